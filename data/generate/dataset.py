@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Shared dataset schema and CSV/Parquet helpers for the Source-to-Settle generator scripts
+"""
+
+import csv
+from pathlib import Path
+import pandas as pd
+
+try:
+    # Optional: typed Parquet copies and the multi-threaded CSV reader
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Generated tables, keyed by the name the scripts use for them
+DATASET_FILES = {
+    'vendors': 'vendors.csv',
+    'invoices': 'invoices.csv',
+    'po_gr': 'po_gr.csv',
+    'supplier_history': 'supplier_history.csv',
+    'events': 'events_sample.csv',
+    'manifest': 'manifest_summary.csv',
+}
+
+# Per-document output folders under the data directory
+OUTPUT_SUBDIRS = ['kyc_samples', 'invoices_pdf', 'contracts', 'supplier_performance']
+
+# Known column dtypes per file so readers skip pandas' type inference
+DTYPES = {
+    'vendors.csv': {
+        'vendor_id': 'str', 'vendor_name': 'str', 'country': 'category', 'state': 'category',
+        'city': 'str', 'industry': 'category', 'contact_email': 'str', 'phone': 'str',
+        'status': 'category', 'risk_band': 'category', 'onboarding_date': 'str', 'last_updated': 'str',
+        'pan': 'str', 'gst': 'str', 'tax_id': 'str', 'registration_number': 'str', 'website': 'str',
+        'primary_contact_name': 'str', 'primary_contact_title': 'category',
+        'bank_account': 'str', 'ifsc_code': 'str', 'swift_code': 'str',
+    },
+    'invoices.csv': {
+        'invoice_id': 'str', 'vendor_id': 'str', 'invoice_number': 'str',
+        'invoice_date': 'str', 'due_date': 'str', 'submission_date': 'str', 'payment_date': 'str',
+        'base_amount': 'float64', 'cgst': 'float64', 'sgst': 'float64', 'igst': 'float64',
+        'total_amount': 'float64', 'currency': 'category', 'status': 'category',
+        'po_reference': 'str', 'gr_reference': 'str', 'payment_terms': 'category',
+        'description': 'str', 'line_items': 'int64',
+    },
+    'po_gr.csv': {
+        'po_id': 'str', 'po_number': 'str', 'vendor_id': 'category', 'po_date': 'str',
+        'po_amount': 'float64', 'currency': 'category', 'description': 'str',
+        'delivery_date': 'str', 'status': 'category', 'line_items_count': 'int64',
+    },
+    'supplier_history.csv': {
+        'vendor_id': 'str', 'vendor_name': 'str', 'total_invoices_processed': 'int64',
+        'total_amount_paid': 'float64', 'on_time_payment_rate': 'float64',
+        'dispute_rate': 'float64', 'average_cycle_time_days': 'int64', 'last_invoice_date': 'str',
+        'risk_band': 'category', 'risk_trend': 'category', 'recommendation': 'category',
+        'quality_score': 'float64', 'delivery_score': 'float64', 'compliance_score': 'float64',
+    },
+    'events_sample.csv': {
+        'event_id': 'str', 'timestamp': 'str', 'vendor_id': 'category', 'invoice_id': 'str',
+        'agent_name': 'category', 'event_type': 'category', 'description': 'str',
+        'status': 'category', 'confidence_score': 'float64', 'processing_time_ms': 'int64',
+    },
+    'manifest_summary.csv': {
+        'generated_date': 'str', 'date_range_start': 'str', 'date_range_end': 'str',
+    },
+}
+
+def make_output_dirs(data_dir):
+    """Create the data directory and every document output folder in one sweep at startup"""
+    for subdir in OUTPUT_SUBDIRS:
+        (Path(data_dir) / subdir).mkdir(parents=True, exist_ok=True)
+
+def _arrow_column_types(filename):
+    """DTYPES for one file as pyarrow types, for pyarrow's CSV reader"""
+    arrow_types = {
+        'str': pa.string(),
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        'float64': pa.float64(),
+        'int64': pa.int64(),
+    }
+    return {column: arrow_types[dtype] for column, dtype in DTYPES.get(filename, {}).items()}
+
+def fast_to_csv(df, path):
+    """Write a DataFrame to CSV through a single large buffered handle"""
+    with open(path, 'w', buffering=1 << 20, newline='', encoding='utf-8') as f:
+        df.to_csv(f, index=False, chunksize=10000, lineterminator='\n')
+
+def write_table(df, data_dir, filename):
+    """Write a table as CSV, plus a zstd Parquet copy next to it when pyarrow is available"""
+    path = Path(data_dir) / filename
+    # The CSVs stay in the pandas format (strings unquoted unless needed, whole floats as 1.0) that downstream
+    # readers expect; pyarrow's CSV writer quotes every string and drops the .0, so it only writes the Parquet copy
+    fast_to_csv(df, path)
+    if HAS_PYARROW:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path.with_suffix('.parquet'), compression='zstd')
+
+def write_record(record, data_dir, filename):
+    """Write a single dict as a header + one-row CSV without building a DataFrame"""
+    with open(Path(data_dir) / filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(record), lineterminator='\n')
+        writer.writeheader()
+        writer.writerow(record)
+
+def read_table(data_dir, filename):
+    """Read one generated table, preferring its Parquet copy over re-parsing the CSV"""
+    path = Path(data_dir) / filename
+    parquet_path = path.with_suffix('.parquet')
+    # Only trust the Parquet copy if it is at least as new as the CSV
+    if HAS_PYARROW and parquet_path.exists() and (
+        not path.exists() or parquet_path.stat().st_mtime >= path.stat().st_mtime
+    ):
+        frame = pd.read_parquet(parquet_path, engine='pyarrow')
+        # Numeric columns follow DTYPES as on the CSV path (e.g. igst is written as int 0 but declared float64)
+        numeric = {
+            column: dtype for column, dtype in DTYPES.get(filename, {}).items()
+            if dtype in ('float64', 'int64') and column in frame
+        }
+        return frame.astype(numeric)
+    # Blank cells stay empty strings on both CSV paths, matching the Parquet copies
+    if HAS_PYARROW:
+        convert_options = pacsv.ConvertOptions(column_types=_arrow_column_types(filename), strings_can_be_null=False)
+        return pacsv.read_csv(path, convert_options=convert_options).to_pandas()
+    return pd.read_csv(
+        path,
+        dtype=DTYPES.get(filename),
+        engine='c',
+        low_memory=False,
+        memory_map=True,
+        keep_default_na=False
+    )
+
+def load_dataset(data_dir):
+    """Read every generated table into a dict keyed like DATASET_FILES"""
+    return {name: read_table(data_dir, filename) for name, filename in DATASET_FILES.items()}
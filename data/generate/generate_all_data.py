@@ -4,21 +4,24 @@ Comprehensive Synthetic Data Generator for Source-to-Settle AI Demo
 Generates ~600+ realistic files across multiple formats
 """
 
+import functools
 import os
 import sys
 import random
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from faker import Faker
 import numpy as np
+from dataset import make_output_dirs, write_table, write_record
 
-# Initialize Faker with multiple locales
+# Initialize Faker with multiple locales (module level so worker processes share it)
 fake = Faker(['en_IN', 'en_US'])
 Faker.seed(42)
 random.seed(42)
-np.random.seed(42)
+rng = np.random.default_rng(42)
 
 # Configuration
 BASE_DIR = Path(__file__).parent
@@ -27,6 +30,11 @@ NUM_VENDORS = 20
 NUM_INVOICES = 80
 NUM_POS = 50
 NUM_EVENTS = 100
+VENDOR_CHUNK_SIZE = 500
+# Supplier counts from which the numba-compiled classifier (when installed) beats its import and load cost
+NUMBA_MIN_ROWS = 10_000
+# Full vendor chunks draw cities and contact names from a pool a quarter their size; smaller chunks call Faker per row
+FAKER_POOL_SIZE = VENDOR_CHUNK_SIZE // 4
 
 # Indian company suffixes
 COMPANY_SUFFIXES = [
@@ -47,19 +55,6 @@ INDIAN_STATES = [
     "West Bengal", "Telangana", "Rajasthan", "Uttar Pradesh", "Kerala"
 ]
 
-print("=" * 80)
-print("SOURCE-TO-SETTLE SYNTHETIC DATA GENERATOR")
-print("=" * 80)
-print(f"Starting data generation at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-print(f"Target: {NUM_VENDORS} vendors, {NUM_INVOICES} invoices, {NUM_POS} POs")
-print("=" * 80)
-
-# ============================================================================
-# PHASE 1: GENERATE VENDOR MASTER DATA
-# ============================================================================
-
-print("\n[1/13] Generating vendor master data...")
-
 def generate_vendor_name():
     """Generate realistic Indian company name"""
     patterns = [
@@ -70,402 +65,592 @@ def generate_vendor_name():
     ]
     return random.choice(patterns)()
 
-def generate_pan():
-    """Generate valid-format PAN number"""
-    return f"{fake.random_uppercase_letter()}{fake.random_uppercase_letter()}{fake.random_uppercase_letter()}{fake.random_uppercase_letter()}{fake.random_uppercase_letter()}{random.randint(1000, 9999)}{fake.random_uppercase_letter()}"
-
-def generate_gst():
-    """Generate valid-format GST number"""
-    state_code = random.randint(10, 36)
-    return f"{state_code}{generate_pan()}{random.randint(1, 9)}Z{fake.random_uppercase_letter()}"
-
-def generate_ifsc():
-    """Generate valid-format IFSC code"""
-    banks = ['SBIN', 'HDFC', 'ICIC', 'AXIS', 'PUNB', 'UTIB', 'KKBK', 'INDB']
-    return f"{random.choice(banks)}0{random.randint(100000, 999999)}"
-
-# Status distribution
-statuses = ['APPROVED'] * 15 + ['PENDING'] * 3 + ['REJECTED'] * 2
-risk_bands = ['LOW'] * 12 + ['MEDIUM'] * 6 + ['HIGH'] * 2
-
-random.shuffle(statuses)
-random.shuffle(risk_bands)
-
-vendors_data = []
-start_date = datetime.now() - timedelta(days=180)
-
-for i in range(1, NUM_VENDORS + 1):
-    vendor_id = f"VENDOR-{i:04d}"
-    onboarding_date = start_date + timedelta(days=random.randint(0, 150))
+IFSC_BANKS = np.array(['SBIN', 'HDFC', 'ICIC', 'AXIS', 'PUNB', 'UTIB', 'KKBK', 'INDB'], dtype='S4')
+
+def _uppercase(rng, shape):
+    return rng.integers(ord('A'), ord('Z') + 1, shape, dtype=np.uint8)
+
+def _digits(rng, shape, low='0'):
+    return rng.integers(ord(low), ord('9') + 1, shape, dtype=np.uint8)
+
+def _pan_chars(n, rng):
+    """(n, 10) ASCII matrix of PANs: 5 letters, 4 digits (1000-9999), 1 letter"""
+    chars = _uppercase(rng, (n, 10))
+    chars[:, 5] = _digits(rng, n, low='1')
+    chars[:, 6:9] = _digits(rng, (n, 3))
+    return chars
+
+def _as_strings(chars):
+    """Turn an (n, width) ASCII matrix into an array of n strings"""
+    return chars.view(f'S{chars.shape[1]}').ravel().astype(str)
+
+def generate_pans(n, rng):
+    """Generate n valid-format PAN numbers"""
+    return _as_strings(_pan_chars(n, rng))
+
+def generate_gsts(n, rng):
+    """Generate n valid-format GST numbers"""
+    chars = np.empty((n, 15), dtype=np.uint8)
+    state_codes = rng.integers(10, 37, n)
+    chars[:, 0] = ord('0') + state_codes // 10
+    chars[:, 1] = ord('0') + state_codes % 10
+    chars[:, 2:12] = _pan_chars(n, rng)
+    chars[:, 12] = _digits(rng, n, low='1')
+    chars[:, 13] = ord('Z')
+    chars[:, 14] = _uppercase(rng, n)
+    return _as_strings(chars)
+
+def generate_ifscs(n, rng):
+    """Generate n valid-format IFSC codes"""
+    chars = np.empty((n, 11), dtype=np.uint8)
+    chars[:, :4] = IFSC_BANKS.view(np.uint8).reshape(-1, 4)[rng.integers(0, len(IFSC_BANKS), n)]
+    chars[:, 4] = ord('0')
+    chars[:, 5] = _digits(rng, n, low='1')
+    chars[:, 6:] = _digits(rng, (n, 5))
+    return _as_strings(chars)
+
+RISK_BANDS = ['LOW', 'MEDIUM', 'HIGH']
+RISK_TRENDS = np.array(['STABLE', 'IMPROVING', 'DECLINING'])
+RECOMMENDATIONS = np.array(['RENEW', 'MONITOR', 'RETENDER'])
+
+def _classify_kernel(on_time, dispute, risk_code, default_trend, out_rec, out_trend):
+    for i in range(on_time.shape[0]):
+        if on_time[i] > 95 and dispute[i] < 2 and risk_code[i] == 0:
+            out_rec[i] = 0
+            out_trend[i] = 0
+        elif on_time[i] < 88 or dispute[i] > 4 or risk_code[i] == 2:
+            out_rec[i] = 2
+            out_trend[i] = 2
+        else:
+            out_rec[i] = 1
+            out_trend[i] = default_trend[i]
+
+@functools.lru_cache(maxsize=None)
+def _compiled_classify_kernel():
+    """_classify_kernel compiled with numba, or None when numba is not installed; imported on first use only"""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_classify_kernel)
+
+def classify_suppliers(on_time, dispute, risk_code, default_trend):
+    """Recommendation and risk-trend codes (indices into RECOMMENDATIONS / RISK_TRENDS) per supplier
+
+    np.select handles the usual sizes; from NUMBA_MIN_ROWS suppliers up the compiled kernel is used if numba is installed.
+    """
+    kernel = _compiled_classify_kernel() if len(on_time) >= NUMBA_MIN_ROWS else None
+    if kernel is not None:
+        rec = np.empty(len(on_time), dtype=np.int8)
+        trend = np.empty(len(on_time), dtype=np.int8)
+        kernel(on_time, dispute, risk_code, default_trend, rec, trend)
+        return rec, trend
+    renew = (on_time > 95) & (dispute < 2) & (risk_code == 0)
+    retender = ~renew & ((on_time < 88) | (dispute > 4) | (risk_code == 2))
+    rec = np.select([renew, retender], [0, 2], default=1).astype(np.int8)
+    trend = np.select([renew, retender], [0, 2], default=default_trend).astype(np.int8)
+    return rec, trend
+
+def faker_column(provider, count, chunk_rng):
+    """count values from a Faker provider; beyond FAKER_POOL_SIZE rows, sample a pool of that many calls instead
+
+    Pass a lambda rather than a bound method: the multi-locale proxy picks the locale on attribute access.
+    """
+    if count <= FAKER_POOL_SIZE:
+        return [provider() for _ in range(count)]
+    pool = np.array([provider() for _ in range(FAKER_POOL_SIZE)], dtype=object)
+    return pool[chunk_rng.integers(0, FAKER_POOL_SIZE, count)].tolist()
+
+def build_vendor_chunk(start, count, seed):
+    """Generate vendor rows start+1 .. start+count (without status/risk band)"""
+    # Each chunk seeds its own generators so results do not depend on which worker runs it
+    Faker.seed(seed)
+    random.seed(seed)
+    chunk_rng = np.random.default_rng(seed)
+
+    start_date = pd.Timestamp(datetime.now() - timedelta(days=180))
+
+    # Build each column in one shot rather than row by row
+    vendor_ids = [f"VENDOR-{i:04d}" for i in range(start + 1, start + count + 1)]
+    onboarding_dates = start_date + pd.to_timedelta(chunk_rng.integers(0, 151, count), unit='D')
+    last_updated_dates = onboarding_dates + pd.to_timedelta(chunk_rng.integers(1, 31, count), unit='D')
 
     # Mix of Indian and international vendors
-    is_indian = random.random() < 0.7
-    country = "India" if is_indian else random.choice(["USA", "UK", "Singapore", "UAE", "Germany"])
+    is_indian = chunk_rng.random(count) < 0.7
+    country = np.where(is_indian, "India", chunk_rng.choice(["USA", "UK", "Singapore", "UAE", "Germany"], count))
+    state = np.where(is_indian, chunk_rng.choice(INDIAN_STATES, count), "")
 
-    vendor = {
-        'vendor_id': vendor_id,
-        'vendor_name': generate_vendor_name(),
+    return pd.DataFrame({
+        'vendor_id': vendor_ids,
+        'vendor_name': [generate_vendor_name() for _ in range(count)],
         'country': country,
-        'state': random.choice(INDIAN_STATES) if is_indian else "",
-        'city': fake.city(),
-        'industry': random.choice(INDUSTRIES),
-        'contact_email': fake.company_email(),
-        'phone': fake.phone_number(),
-        'status': statuses[i-1],
-        'risk_band': risk_bands[i-1],
-        'onboarding_date': onboarding_date.strftime('%Y-%m-%d'),
-        'last_updated': (onboarding_date + timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d'),
-        'pan': generate_pan() if is_indian else "",
-        'gst': generate_gst() if is_indian else "",
-        'tax_id': "" if is_indian else fake.ean13(),
-        'registration_number': f"CIN-{fake.bothify(text='U#####MH####PTC######')}" if is_indian else fake.bothify(text='REG-########'),
-        'website': fake.url(),
-        'primary_contact_name': fake.name(),
-        'primary_contact_title': random.choice(['Manager', 'Director', 'VP Operations', 'CFO', 'Head of Procurement']),
-        'bank_account': fake.bban(),
-        'ifsc_code': generate_ifsc() if is_indian else "",
-        'swift_code': fake.swift() if not is_indian else ""
-    }
-    vendors_data.append(vendor)
-
-vendors_df = pd.DataFrame(vendors_data)
-vendors_df.to_csv(DATA_DIR / "vendors.csv", index=False)
-print(f"   ✓ Generated {len(vendors_df)} vendors")
-print(f"     - {len(vendors_df[vendors_df['status']=='APPROVED'])} APPROVED")
-print(f"     - {len(vendors_df[vendors_df['status']=='PENDING'])} PENDING")
-print(f"     - {len(vendors_df[vendors_df['status']=='REJECTED'])} REJECTED")
-
-# ============================================================================
-# PHASE 2: GENERATE PURCHASE ORDERS & GOODS RECEIPTS
-# ============================================================================
-
-print("\n[2/13] Generating Purchase Orders and Goods Receipts...")
-
-# Only create POs for approved vendors
-approved_vendors = vendors_df[vendors_df['status'] == 'APPROVED']['vendor_id'].tolist()
-
-po_data = []
-gr_data = []
-po_start_date = datetime.now() - timedelta(days=120)
-
-for i in range(1, NUM_POS + 1):
-    po_id = f"PO-{i:04d}"
-    vendor_id = random.choice(approved_vendors)
-    po_date = po_start_date + timedelta(days=random.randint(0, 90))
-    po_amount = round(random.uniform(50000, 5000000), 2)
+        'state': state,
+        'city': faker_column(lambda: fake.city(), count, chunk_rng),
+        'industry': chunk_rng.choice(INDUSTRIES, count),
+        'contact_email': [fake.company_email() for _ in range(count)],
+        'phone': [fake.phone_number() for _ in range(count)],
+        'onboarding_date': onboarding_dates.strftime('%Y-%m-%d'),
+        'last_updated': last_updated_dates.strftime('%Y-%m-%d'),
+        'pan': np.where(is_indian, generate_pans(count, chunk_rng), ""),
+        'gst': np.where(is_indian, generate_gsts(count, chunk_rng), ""),
+        'tax_id': ["" if indian else fake.ean13() for indian in is_indian],
+        'registration_number': [
+            f"CIN-{fake.bothify(text='U#####MH####PTC######')}" if indian else fake.bothify(text='REG-########')
+            for indian in is_indian
+        ],
+        'website': [fake.url() for _ in range(count)],
+        'primary_contact_name': faker_column(lambda: fake.name(), count, chunk_rng),
+        'primary_contact_title': chunk_rng.choice(['Manager', 'Director', 'VP Operations', 'CFO', 'Head of Procurement'], count),
+        'bank_account': [fake.bban() for _ in range(count)],
+        'ifsc_code': np.where(is_indian, generate_ifscs(count, chunk_rng), ""),
+        'swift_code': ["" if indian else fake.swift() for indian in is_indian]
+    })
+
+def build_in_chunks(builder, total, chunk_size):
+    """Run a chunk builder over `total` rows, fanning out to worker processes when there are several chunks"""
+    tasks = [(start, min(chunk_size, total - start), 42 + idx)
+             for idx, start in enumerate(range(0, total, chunk_size))]
+    if len(tasks) == 1:
+        return builder(*tasks[0])
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return pd.concat(pool.map(builder, *zip(*tasks)), ignore_index=True)
+
+def generate_all():
+    """Generate and write every CSV table, returning the generated frames for callers in the same process
+
+    Keys follow dataset.DATASET_FILES, plus 'goods_receipts', which is kept in memory only (no CSV is written
+    for it); 'manifest' is the summary dict. The later pipeline scripts run as their own processes and read
+    the tables back with dataset.load_dataset.
+    """
+    print("=" * 80)
+    print("SOURCE-TO-SETTLE SYNTHETIC DATA GENERATOR")
+    print("=" * 80)
+    print(f"Starting data generation at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Target: {NUM_VENDORS} vendors, {NUM_INVOICES} invoices, {NUM_POS} POs")
+    print("=" * 80)
+
+    make_output_dirs(DATA_DIR)
+
+    # ============================================================================
+    # PHASE 1: GENERATE VENDOR MASTER DATA
+    # ============================================================================
+
+    print("\n[1/13] Generating vendor master data...")
+
+    # Status distribution
+    statuses = ['APPROVED'] * 15 + ['PENDING'] * 3 + ['REJECTED'] * 2
+    risk_bands = ['LOW'] * 12 + ['MEDIUM'] * 6 + ['HIGH'] * 2
+
+    random.shuffle(statuses)
+    random.shuffle(risk_bands)
+
+    vendors_df = build_in_chunks(build_vendor_chunk, NUM_VENDORS, VENDOR_CHUNK_SIZE)
+    vendors_df.insert(8, 'status', statuses)
+    vendors_df.insert(9, 'risk_band', risk_bands)
+    # Low-cardinality columns as categoricals: smaller and faster to mask on
+    vendors_df = vendors_df.astype({c: 'category' for c in ['country', 'state', 'industry', 'status', 'risk_band', 'primary_contact_title']})
+    write_table(vendors_df, DATA_DIR, "vendors.csv")
+    vendor_status_counts = vendors_df['status'].value_counts()
+    # Split by status once; later phases reuse the groups instead of re-masking
+    vendors_by_status = dict(tuple(vendors_df.groupby('status', observed=True, sort=False)))
+    approved_df = vendors_by_status.get('APPROVED', vendors_df.iloc[:0])
+    print(f"   ✓ Generated {len(vendors_df)} vendors")
+    print(f"     - {vendor_status_counts.get('APPROVED', 0)} APPROVED")
+    print(f"     - {vendor_status_counts.get('PENDING', 0)} PENDING")
+    print(f"     - {vendor_status_counts.get('REJECTED', 0)} REJECTED")
+
+    # ============================================================================
+    # PHASE 2: GENERATE PURCHASE ORDERS & GOODS RECEIPTS
+    # ============================================================================
+
+    print("\n[2/13] Generating Purchase Orders and Goods Receipts...")
+
+    # Only create POs for approved vendors
+    approved_vendors = approved_df['vendor_id'].tolist()
+
+    po_start_date = pd.Timestamp(datetime.now() - timedelta(days=120))
+
+    po_vendor_ids = rng.choice(approved_vendors, NUM_POS)
+    po_dates = po_start_date + pd.to_timedelta(rng.integers(0, 91, NUM_POS), unit='D')
+    po_amounts = np.round(rng.uniform(50000, 5000000, NUM_POS), 2)
+    delivery_dates = po_dates + pd.to_timedelta(rng.integers(15, 46, NUM_POS), unit='D')
 
     # 70% have GR, 30% are still open
-    has_gr = random.random() < 0.7
-
-    po = {
-        'po_id': po_id,
-        'po_number': f"PO{fake.bothify(text='####-####')}",
-        'vendor_id': vendor_id,
-        'po_date': po_date.strftime('%Y-%m-%d'),
-        'po_amount': po_amount,
+    has_gr = rng.random(NUM_POS) < 0.7
+
+    po_df = pd.DataFrame({
+        'po_id': [f"PO-{i:04d}" for i in range(1, NUM_POS + 1)],
+        'po_number': [f"PO{fake.bothify(text='####-####')}" for _ in range(NUM_POS)],
+        'vendor_id': po_vendor_ids,
+        'po_date': po_dates.strftime('%Y-%m-%d'),
+        'po_amount': po_amounts,
         'currency': 'INR',
-        'description': fake.catch_phrase(),
-        'delivery_date': (po_date + timedelta(days=random.randint(15, 45))).strftime('%Y-%m-%d'),
-        'status': 'CLOSED' if has_gr else 'OPEN',
-        'line_items_count': random.randint(1, 10)
-    }
-    po_data.append(po)
-
-    if has_gr:
-        gr_date = po_date + timedelta(days=random.randint(10, 40))
-        # Sometimes GR amount differs slightly
-        gr_amount = po_amount if random.random() < 0.8 else round(po_amount * random.uniform(0.95, 1.0), 2)
-
-        gr = {
-            'gr_id': f"GR-{len(gr_data) + 1:04d}",
-            'gr_number': f"GR{fake.bothify(text='####-####')}",
-            'po_id': po_id,
-            'vendor_id': vendor_id,
-            'gr_date': gr_date.strftime('%Y-%m-%d'),
-            'gr_amount': gr_amount,
-            'quantity_received': random.randint(1, 100),
-            'warehouse': random.choice(['WH-Mumbai', 'WH-Bangalore', 'WH-Delhi', 'WH-Chennai']),
-            'received_by': fake.name()
-        }
-        gr_data.append(gr)
-
-po_df = pd.DataFrame(po_data)
-gr_df = pd.DataFrame(gr_data)
-
-po_df.to_csv(DATA_DIR / "po_gr.csv", index=False)
-print(f"   ✓ Generated {len(po_df)} Purchase Orders")
-print(f"     - {len(po_df[po_df['status']=='CLOSED'])} with GR")
-print(f"     - {len(po_df[po_df['status']=='OPEN'])} still open")
-print(f"   ✓ Generated {len(gr_df)} Goods Receipts")
-
-# ============================================================================
-# PHASE 3: GENERATE INVOICE DATA
-# ============================================================================
-
-print("\n[3/13] Generating invoice master data...")
-
-# Status distribution
-invoice_statuses = (
-    ['MATCHED'] * 50 +
-    ['DUPLICATE'] * 10 +
-    ['EXCEPTION'] * 15 +
-    ['PENDING'] * 5
-)
-random.shuffle(invoice_statuses)
-
-invoices_data = []
-invoice_start_date = datetime.now() - timedelta(days=90)
-
-# Create mapping of PO to invoices
-pos_with_gr = po_df[po_df['status'] == 'CLOSED'].to_dict('records')
-
-for i in range(1, NUM_INVOICES + 1):
-    invoice_id = f"INV-{i:04d}"
-    status = invoice_statuses[i-1]
-
-    # Select vendor and PO
-    if status in ['MATCHED', 'PAID'] and pos_with_gr:
-        po = random.choice(pos_with_gr)
-        vendor_id = po['vendor_id']
-        po_reference = po['po_id']
-        amount = po['po_amount']
-
-        # Find corresponding GR
-        gr = gr_df[gr_df['po_id'] == po_reference].iloc[0] if len(gr_df[gr_df['po_id'] == po_reference]) > 0 else None
-        gr_reference = gr['gr_id'] if gr is not None else ""
-    else:
-        vendor_id = random.choice(approved_vendors)
-        po_reference = ""
-        gr_reference = ""
-        amount = round(random.uniform(10000, 1000000), 2)
-
-    invoice_date = invoice_start_date + timedelta(days=random.randint(0, 80))
-
-    # For exceptions, introduce issues
-    if status == 'EXCEPTION':
-        # Randomly create different types of exceptions
-        exception_type = random.choice(['amount_mismatch', 'missing_po', 'date_issue'])
-        if exception_type == 'amount_mismatch' and po_reference:
-            amount = amount * random.uniform(0.8, 1.3)  # Wrong amount
-        elif exception_type == 'missing_po':
+        'description': [fake.catch_phrase() for _ in range(NUM_POS)],
+        'delivery_date': delivery_dates.strftime('%Y-%m-%d'),
+        'status': np.where(has_gr, 'CLOSED', 'OPEN'),
+        'line_items_count': rng.integers(1, 11, NUM_POS)
+    })
+
+    # Goods receipts for the closed POs
+    gr_rows = np.flatnonzero(has_gr)
+    num_grs = len(gr_rows)
+    gr_dates = po_dates[gr_rows] + pd.to_timedelta(rng.integers(10, 41, num_grs), unit='D')
+    # Sometimes GR amount differs slightly
+    gr_amounts = np.where(
+        rng.random(num_grs) < 0.8,
+        po_amounts[gr_rows],
+        np.round(po_amounts[gr_rows] * rng.uniform(0.95, 1.0, num_grs), 2)
+    )
+
+    gr_df = pd.DataFrame({
+        'gr_id': [f"GR-{i:04d}" for i in range(1, num_grs + 1)],
+        'gr_number': [f"GR{fake.bothify(text='####-####')}" for _ in range(num_grs)],
+        'po_id': po_df['po_id'].to_numpy()[gr_rows],
+        'vendor_id': po_vendor_ids[gr_rows],
+        'gr_date': gr_dates.strftime('%Y-%m-%d'),
+        'gr_amount': gr_amounts,
+        'quantity_received': rng.integers(1, 101, num_grs),
+        'warehouse': rng.choice(['WH-Mumbai', 'WH-Bangalore', 'WH-Delhi', 'WH-Chennai'], num_grs),
+        'received_by': [fake.name() for _ in range(num_grs)]
+    })
+    gr_by_po = gr_df.groupby('po_id')['gr_id'].first().to_dict()
+
+    po_df = po_df.astype({c: 'category' for c in ['vendor_id', 'currency', 'status']})
+    gr_df = gr_df.astype({c: 'category' for c in ['vendor_id', 'warehouse']})
+
+    write_table(po_df, DATA_DIR, "po_gr.csv")
+    po_status_counts = po_df['status'].value_counts()
+    print(f"   ✓ Generated {len(po_df)} Purchase Orders")
+    print(f"     - {po_status_counts.get('CLOSED', 0)} with GR")
+    print(f"     - {po_status_counts.get('OPEN', 0)} still open")
+    print(f"   ✓ Generated {len(gr_df)} Goods Receipts")
+
+    # ============================================================================
+    # PHASE 3: GENERATE INVOICE DATA
+    # ============================================================================
+
+    print("\n[3/13] Generating invoice master data...")
+
+    # Status distribution
+    invoice_statuses = (
+        ['MATCHED'] * 50 +
+        ['DUPLICATE'] * 10 +
+        ['EXCEPTION'] * 15 +
+        ['PENDING'] * 5
+    )
+    random.shuffle(invoice_statuses)
+
+    invoice_start_date = pd.Timestamp(datetime.now() - timedelta(days=90))
+
+    # Create mapping of PO to invoices
+    closed_pos = po_df[po_df['status'] == 'CLOSED']
+    pos_with_gr = list(zip(closed_pos['po_id'], closed_pos['vendor_id'], closed_pos['po_amount']))
+
+    # Draw every per-invoice random value up front
+    po_picks = rng.integers(0, max(len(pos_with_gr), 1), NUM_INVOICES)
+    fallback_vendors = rng.choice(approved_vendors, NUM_INVOICES)
+    fallback_amounts = np.round(rng.uniform(10000, 1000000, NUM_INVOICES), 2)
+    invoice_day_offsets = rng.integers(0, 81, NUM_INVOICES)
+    exception_types = rng.choice(['amount_mismatch', 'missing_po', 'date_issue'], NUM_INVOICES)
+    mismatch_factors = rng.uniform(0.8, 1.3, NUM_INVOICES)
+    due_day_offsets = rng.choice([30, 45, 60], NUM_INVOICES)
+    submission_day_offsets = rng.integers(0, 6, NUM_INVOICES)
+    payment_day_offsets = rng.integers(30, 61, NUM_INVOICES)
+    invoice_payment_terms = rng.choice(['Net 30', 'Net 45', 'Net 60', 'Due on Receipt'], NUM_INVOICES)
+    invoice_line_items = rng.integers(1, 9, NUM_INVOICES)
+
+    # One pre-allocated array per output column, filled by index
+    invoice_vendor_col = np.empty(NUM_INVOICES, dtype=object)
+    po_reference_col = np.empty(NUM_INVOICES, dtype=object)
+    gr_reference_col = np.empty(NUM_INVOICES, dtype=object)
+    description_col = np.empty(NUM_INVOICES, dtype=object)
+    amount_col = np.empty(NUM_INVOICES, dtype=np.float64)
+
+    for row in range(NUM_INVOICES):
+        status = invoice_statuses[row]
+
+        # Select vendor and PO
+        if status in ['MATCHED', 'PAID'] and pos_with_gr:
+            po_reference, vendor_id, amount = pos_with_gr[po_picks[row]]
+
+            # Find corresponding GR
+            gr_reference = gr_by_po.get(po_reference, "")
+        else:
+            vendor_id = fallback_vendors[row]
             po_reference = ""
             gr_reference = ""
+            amount = fallback_amounts[row]
+
+        invoice_vendor_col[row] = vendor_id
+        po_reference_col[row] = po_reference
+        gr_reference_col[row] = gr_reference
+        description_col[row] = fake.bs()
+        amount_col[row] = amount
+
+    status_arr = np.asarray(invoice_statuses)
+    invoice_number_col = np.array(
+        [f"INV-{vendor_id.split('-')[1]}-{fake.bothify(text='####')}" for vendor_id in invoice_vendor_col],
+        dtype=object
+    )
 
-    # For duplicates, reuse invoice numbers
-    if status == 'DUPLICATE' and i > 10:
-        duplicate_invoice = invoices_data[random.randint(max(0, i-20), i-2)]
-        invoice_number = duplicate_invoice['invoice_number']
-        vendor_id = duplicate_invoice['vendor_id']
-    else:
-        invoice_number = f"INV-{vendor_id.split('-')[1]}-{fake.bothify(text='####')}"
-
-    # Tax calculation
-    base_amount = amount / 1.18  # Assuming 18% GST
-    cgst = round(base_amount * 0.09, 2)
-    sgst = round(base_amount * 0.09, 2)
-    total_amount = round(base_amount + cgst + sgst, 2)
-
-    invoice = {
-        'invoice_id': invoice_id,
-        'vendor_id': vendor_id,
-        'invoice_number': invoice_number,
-        'invoice_date': invoice_date.strftime('%Y-%m-%d'),
-        'due_date': (invoice_date + timedelta(days=random.choice([30, 45, 60]))).strftime('%Y-%m-%d'),
-        'base_amount': round(base_amount, 2),
+    # For duplicates, reuse the invoice number and vendor of one of the previous ~20 invoices
+    dup_rows = np.flatnonzero(status_arr == 'DUPLICATE')
+    dup_rows = dup_rows[dup_rows >= 10]
+    source_rows = np.arange(NUM_INVOICES)
+    source_rows[dup_rows] = rng.integers(np.maximum(0, dup_rows - 19), dup_rows)
+    # Follow chains (a duplicate of a duplicate) back to an original invoice
+    while not np.array_equal(source_rows[source_rows], source_rows):
+        source_rows = source_rows[source_rows]
+    invoice_number_col = invoice_number_col[source_rows]
+    invoice_vendor_col = invoice_vendor_col[source_rows]
+
+    # For exceptions, introduce issues across the whole batch with masks
+    exception_kind = np.where(status_arr == 'EXCEPTION', exception_types, '')
+    amount_mismatch = (exception_kind == 'amount_mismatch') & (po_reference_col != "")
+    amount_col = np.where(amount_mismatch, amount_col * mismatch_factors, amount_col)  # Wrong amount
+    missing_po = exception_kind == 'missing_po'
+    po_reference_col[missing_po] = ""
+    gr_reference_col[missing_po] = ""
+
+    # Date columns from the day offsets, formatted once per column
+    invoice_dates = invoice_start_date + pd.to_timedelta(invoice_day_offsets, unit='D')
+    due_dates = invoice_dates + pd.to_timedelta(due_day_offsets, unit='D')
+    submission_dates = invoice_dates + pd.to_timedelta(submission_day_offsets, unit='D')
+    payment_dates = invoice_dates + pd.to_timedelta(payment_day_offsets, unit='D')
+    is_paid = status_arr == 'PAID'
+
+    # Tax calculation over all invoices at once
+    base_amounts = amount_col / 1.18  # Assuming 18% GST
+    cgst = np.round(base_amounts * 0.09, 2)
+    sgst = cgst.copy()
+    total_amounts = np.round(base_amounts + cgst + sgst, 2)
+
+    invoices_df = pd.DataFrame({
+        'invoice_id': [f"INV-{i:04d}" for i in range(1, NUM_INVOICES + 1)],
+        'vendor_id': invoice_vendor_col,
+        'invoice_number': invoice_number_col,
+        'invoice_date': invoice_dates.strftime('%Y-%m-%d'),
+        'due_date': due_dates.strftime('%Y-%m-%d'),
+        'base_amount': np.round(base_amounts, 2),
         'cgst': cgst,
         'sgst': sgst,
         'igst': 0,
-        'total_amount': total_amount,
+        'total_amount': total_amounts,
         'currency': 'INR',
-        'status': status,
-        'po_reference': po_reference,
-        'gr_reference': gr_reference,
-        'submission_date': (invoice_date + timedelta(days=random.randint(0, 5))).strftime('%Y-%m-%d'),
-        'payment_date': (invoice_date + timedelta(days=random.randint(30, 60))).strftime('%Y-%m-%d') if status == 'PAID' else "",
-        'payment_terms': random.choice(['Net 30', 'Net 45', 'Net 60', 'Due on Receipt']),
-        'description': fake.bs(),
-        'line_items': random.randint(1, 8)
-    }
-    invoices_data.append(invoice)
-
-invoices_df = pd.DataFrame(invoices_data)
-invoices_df.to_csv(DATA_DIR / "invoices.csv", index=False)
-print(f"   ✓ Generated {len(invoices_df)} invoices")
-print(f"     - {len(invoices_df[invoices_df['status']=='MATCHED'])} MATCHED")
-print(f"     - {len(invoices_df[invoices_df['status']=='DUPLICATE'])} DUPLICATE")
-print(f"     - {len(invoices_df[invoices_df['status']=='EXCEPTION'])} EXCEPTION")
-print(f"     - {len(invoices_df[invoices_df['status']=='PENDING'])} PENDING")
-
-# ============================================================================
-# PHASE 4: GENERATE SUPPLIER HISTORY & ANALYTICS
-# ============================================================================
-
-print("\n[4/13] Generating supplier history and analytics...")
-
-supplier_history = []
-
-for vendor_id in approved_vendors:
-    vendor_invoices = invoices_df[invoices_df['vendor_id'] == vendor_id]
-
-    if len(vendor_invoices) == 0:
-        continue
-
-    total_invoices = len(vendor_invoices)
-    total_amount = vendor_invoices['total_amount'].sum()
+        'status': invoice_statuses,
+        'po_reference': po_reference_col,
+        'gr_reference': gr_reference_col,
+        'submission_date': submission_dates.strftime('%Y-%m-%d'),
+        'payment_date': np.where(is_paid, payment_dates.strftime('%Y-%m-%d'), ""),
+        'payment_terms': invoice_payment_terms,
+        'description': description_col,
+        'line_items': invoice_line_items
+    })
+    invoices_df = invoices_df.astype({c: 'category' for c in ['currency', 'status', 'payment_terms']})
+    write_table(invoices_df, DATA_DIR, "invoices.csv")
+    invoice_status_counts = invoices_df['status'].value_counts()
+    print(f"   ✓ Generated {len(invoices_df)} invoices")
+    print(f"     - {invoice_status_counts.get('MATCHED', 0)} MATCHED")
+    print(f"     - {invoice_status_counts.get('DUPLICATE', 0)} DUPLICATE")
+    print(f"     - {invoice_status_counts.get('EXCEPTION', 0)} EXCEPTION")
+    print(f"     - {invoice_status_counts.get('PENDING', 0)} PENDING")
+
+    # ============================================================================
+    # PHASE 4: GENERATE SUPPLIER HISTORY & ANALYTICS
+    # ============================================================================
+
+    print("\n[4/13] Generating supplier history and analytics...")
+
+    # One pass over the invoices for every vendor's totals
+    invoice_stats = invoices_df.groupby('vendor_id', sort=False).agg(
+        total_invoices_processed=('invoice_id', 'count'),
+        total_amount_paid=('total_amount', 'sum'),
+        last_invoice_date=('invoice_date', 'max')
+    ).reset_index()
+
+    approved_info = approved_df[['vendor_id', 'vendor_name', 'risk_band']]
+    supplier_df = approved_info.merge(invoice_stats, on='vendor_id', how='inner')
+    num_suppliers = len(supplier_df)
 
     # Calculate KPIs
-    on_time_rate = round(random.uniform(85, 98), 2)
-    dispute_rate = round(random.uniform(0, 5), 2)
-    cycle_time = random.randint(15, 45)
+    on_time_rate = np.round(rng.uniform(85, 98, num_suppliers), 2)
+    dispute_rate = np.round(rng.uniform(0, 5, num_suppliers), 2)
+    risk_code = pd.Categorical(supplier_df['risk_band'], categories=RISK_BANDS).codes
+    cycle_time_days = rng.integers(15, 46, num_suppliers)
 
     # Determine recommendation based on performance and risk
-    vendor_info = vendors_df[vendors_df['vendor_id'] == vendor_id].iloc[0]
-    risk = vendor_info['risk_band']
-
-    if on_time_rate > 95 and dispute_rate < 2 and risk == 'LOW':
-        recommendation = 'RENEW'
-        risk_trend = 'STABLE'
-    elif on_time_rate < 88 or dispute_rate > 4 or risk == 'HIGH':
-        recommendation = 'RETENDER'
-        risk_trend = 'DECLINING'
-    else:
-        recommendation = 'MONITOR'
-        risk_trend = random.choice(['STABLE', 'IMPROVING'])
-
-    history = {
-        'vendor_id': vendor_id,
-        'vendor_name': vendor_info['vendor_name'],
-        'total_invoices_processed': total_invoices,
-        'total_amount_paid': round(total_amount, 2),
-        'on_time_payment_rate': on_time_rate,
-        'dispute_rate': dispute_rate,
-        'average_cycle_time_days': cycle_time,
-        'last_invoice_date': vendor_invoices['invoice_date'].max(),
-        'risk_band': risk,
-        'risk_trend': risk_trend,
-        'recommendation': recommendation,
-        'quality_score': round(random.uniform(75, 98), 2),
-        'delivery_score': round(random.uniform(80, 99), 2),
-        'compliance_score': round(random.uniform(85, 100), 2)
-    }
-    supplier_history.append(history)
-
-supplier_df = pd.DataFrame(supplier_history)
-supplier_df.to_csv(DATA_DIR / "supplier_history.csv", index=False)
-print(f"   ✓ Generated supplier history for {len(supplier_df)} vendors")
-print(f"     - {len(supplier_df[supplier_df['recommendation']=='RENEW'])} recommended for RENEW")
-print(f"     - {len(supplier_df[supplier_df['recommendation']=='MONITOR'])} recommended to MONITOR")
-print(f"     - {len(supplier_df[supplier_df['recommendation']=='RETENDER'])} recommended for RETENDER")
-
-# ============================================================================
-# PHASE 5: GENERATE EVENTS LOG
-# ============================================================================
-
-print("\n[5/13] Generating events and audit trail...")
-
-agents = [
-    'VendorIntakeAgent',
-    'RiskGuardAgent',
-    'ContractCraftAgent',
-    'InvoiceIQAgent',
-    'PayFlowAgent',
-    'Supplier360Agent'
-]
+    recommendation_code, risk_trend_code = classify_suppliers(
+        on_time_rate, dispute_rate, risk_code, rng.integers(0, 2, num_suppliers)
+    )
 
-event_types = [
-    'VENDOR_CREATED', 'VENDOR_APPROVED', 'VENDOR_REJECTED',
-    'KYC_EXTRACTED', 'RISK_ASSESSED', 'RISK_ESCALATED',
-    'CONTRACT_GENERATED', 'CONTRACT_REVIEWED', 'CONTRACT_SIGNED',
-    'INVOICE_RECEIVED', 'INVOICE_OCR_COMPLETED', 'INVOICE_MATCHED',
-    'INVOICE_DUPLICATE_DETECTED', 'INVOICE_EXCEPTION_FLAGGED',
-    'PAYMENT_QUEUED', 'PAYMENT_PROCESSED', 'PAYMENT_FAILED',
-    'PERFORMANCE_CALCULATED', 'RECOMMENDATION_GENERATED'
-]
+    # Add every KPI column in one assign, each from its own 1-D array
+    supplier_df = supplier_df.assign(
+        total_amount_paid=np.round(supplier_df['total_amount_paid'].to_numpy(), 2),
+        on_time_payment_rate=on_time_rate,
+        dispute_rate=dispute_rate,
+        average_cycle_time_days=cycle_time_days,
+        risk_trend=RISK_TRENDS[risk_trend_code],
+        recommendation=RECOMMENDATIONS[recommendation_code],
+        quality_score=np.round(rng.uniform(75, 98, num_suppliers), 2),
+        delivery_score=np.round(rng.uniform(80, 99, num_suppliers), 2),
+        compliance_score=np.round(rng.uniform(85, 100, num_suppliers), 2)
+    )
+
+    supplier_df = supplier_df[[
+        'vendor_id', 'vendor_name', 'total_invoices_processed', 'total_amount_paid',
+        'on_time_payment_rate', 'dispute_rate', 'average_cycle_time_days', 'last_invoice_date',
+        'risk_band', 'risk_trend', 'recommendation', 'quality_score', 'delivery_score', 'compliance_score'
+    ]]
+    supplier_df = supplier_df.astype({c: 'category' for c in ['risk_band', 'risk_trend', 'recommendation']})
+    write_table(supplier_df, DATA_DIR, "supplier_history.csv")
+    recommendation_counts = supplier_df['recommendation'].value_counts()
+    print(f"   ✓ Generated supplier history for {len(supplier_df)} vendors")
+    print(f"     - {recommendation_counts.get('RENEW', 0)} recommended for RENEW")
+    print(f"     - {recommendation_counts.get('MONITOR', 0)} recommended to MONITOR")
+    print(f"     - {recommendation_counts.get('RETENDER', 0)} recommended for RETENDER")
+
+    # ============================================================================
+    # PHASE 5: GENERATE EVENTS LOG
+    # ============================================================================
+
+    print("\n[5/13] Generating events and audit trail...")
+
+    agents = [
+        'VendorIntakeAgent',
+        'RiskGuardAgent',
+        'ContractCraftAgent',
+        'InvoiceIQAgent',
+        'PayFlowAgent',
+        'Supplier360Agent'
+    ]
 
-events_data = []
-event_start = datetime.now() - timedelta(days=60)
+    event_types = [
+        'VENDOR_CREATED', 'VENDOR_APPROVED', 'VENDOR_REJECTED',
+        'KYC_EXTRACTED', 'RISK_ASSESSED', 'RISK_ESCALATED',
+        'CONTRACT_GENERATED', 'CONTRACT_REVIEWED', 'CONTRACT_SIGNED',
+        'INVOICE_RECEIVED', 'INVOICE_OCR_COMPLETED', 'INVOICE_MATCHED',
+        'INVOICE_DUPLICATE_DETECTED', 'INVOICE_EXCEPTION_FLAGGED',
+        'PAYMENT_QUEUED', 'PAYMENT_PROCESSED', 'PAYMENT_FAILED',
+        'PERFORMANCE_CALCULATED', 'RECOMMENDATION_GENERATED'
+    ]
+
+    event_start = pd.Timestamp(datetime.now() - timedelta(days=60))
 
-for i in range(1, NUM_EVENTS + 1):
-    event_time = event_start + timedelta(
-        days=random.randint(0, 59),
-        hours=random.randint(9, 18),
-        minutes=random.randint(0, 59)
+    # Draw every per-event random value up front
+    # Business-hours minute offsets, sorted up front so events are built in time order
+    event_minute_offsets = np.sort(
+        rng.integers(0, 60, NUM_EVENTS) * 24 * 60
+        + rng.integers(9, 19, NUM_EVENTS) * 60
+        + rng.integers(0, 60, NUM_EVENTS)
     )
+    event_vendors = rng.choice(approved_vendors, NUM_EVENTS)
+    event_agents = rng.choice(agents, NUM_EVENTS)
+    event_type_picks = rng.choice(event_types, NUM_EVENTS)
+    event_risk_scores = rng.integers(60, 96, NUM_EVENTS)
+    event_payments = rng.integers(50000, 500001, NUM_EVENTS)
+    event_recommendations = rng.choice(['RENEW', 'MONITOR', 'RETENDER'], NUM_EVENTS)
+    event_statuses = rng.choice(['SUCCESS', 'WARNING', 'ERROR'], NUM_EVENTS, p=[0.85, 0.10, 0.05])
+    event_confidence = np.round(rng.uniform(0.75, 0.99, NUM_EVENTS), 4)
+    event_processing_ms = rng.integers(100, 5001, NUM_EVENTS)
+
+    # Loop invariants: the invoice id pool and which events reference an invoice
+    invoice_ids = invoices_df['invoice_id'].to_numpy()
+    is_invoice_evt = np.array(['INVOICE' in t for t in event_type_picks])
+    event_invoice_col = np.where(is_invoice_evt, invoice_ids[rng.integers(0, len(invoice_ids), NUM_EVENTS)], "")
+
+    # One pre-allocated array per output column, filled by index
+    event_description_col = np.empty(NUM_EVENTS, dtype=object)
+
+    for row in range(NUM_EVENTS):
+        vendor_id = event_vendors[row]
+        agent = event_agents[row]
+        event_type = event_type_picks[row]
+
+        # Generate contextual descriptions
+        descriptions = {
+            'VENDOR_CREATED': f"New vendor profile created for {vendor_id}",
+            'RISK_ASSESSED': f"Risk score calculated: {event_risk_scores[row]}/100. Risk band assigned.",
+            'INVOICE_MATCHED': f"Invoice successfully matched to PO and GR. Amount validated.",
+            'INVOICE_DUPLICATE_DETECTED': f"Duplicate invoice detected. Same invoice number already processed.",
+            'PAYMENT_PROCESSED': f"Payment of ₹{event_payments[row]:,} processed successfully",
+            'RECOMMENDATION_GENERATED': f"Performance analysis complete. Recommendation: {event_recommendations[row]}"
+        }
 
-    vendor_id = random.choice(approved_vendors)
-    agent = random.choice(agents)
-    event_type = random.choice(event_types)
-
-    # Generate contextual descriptions
-    descriptions = {
-        'VENDOR_CREATED': f"New vendor profile created for {vendor_id}",
-        'RISK_ASSESSED': f"Risk score calculated: {random.randint(60, 95)}/100. Risk band assigned.",
-        'INVOICE_MATCHED': f"Invoice successfully matched to PO and GR. Amount validated.",
-        'INVOICE_DUPLICATE_DETECTED': f"Duplicate invoice detected. Same invoice number already processed.",
-        'PAYMENT_PROCESSED': f"Payment of ₹{random.randint(50000, 500000):,} processed successfully",
-        'RECOMMENDATION_GENERATED': f"Performance analysis complete. Recommendation: {random.choice(['RENEW', 'MONITOR', 'RETENDER'])}"
+        event_description_col[row] = descriptions.get(event_type, f"{agent} processed {event_type} for {vendor_id}")
+
+    event_times = event_start + pd.to_timedelta(event_minute_offsets, unit='m')
+
+    events_df = pd.DataFrame({
+        'event_id': [f"EVT-{i:05d}" for i in range(1, NUM_EVENTS + 1)],
+        'timestamp': event_times,
+        'vendor_id': event_vendors,
+        'invoice_id': event_invoice_col,
+        'agent_name': event_agents,
+        'event_type': event_type_picks,
+        'description': event_description_col,
+        'status': event_statuses,
+        'confidence_score': event_confidence,
+        'processing_time_ms': event_processing_ms
+    })
+    events_df = events_df.astype({c: 'category' for c in ['vendor_id', 'agent_name', 'event_type', 'status']})
+    # Already in timestamp order; stringify only for the CSV
+    write_table(
+        events_df.assign(timestamp=events_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')),
+        DATA_DIR, "events_sample.csv"
+    )
+    event_status_counts = events_df['status'].value_counts()
+    print(f"   ✓ Generated {len(events_df)} event records")
+    print(f"     - {event_status_counts.get('SUCCESS', 0)} successful")
+    print(f"     - {event_status_counts.get('WARNING', 0)} warnings")
+    print(f"     - {event_status_counts.get('ERROR', 0)} errors")
+
+    # ============================================================================
+    # PHASE 6: GENERATE MANIFEST & SUMMARY
+    # ============================================================================
+
+    print("\n[6/13] Generating manifest summary...")
+
+    manifest = {
+        'dataset_name': 'Source-to-Settle AI Demo Dataset',
+        'version': '1.0.0',
+        'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'total_vendors': len(vendors_df),
+        'total_invoices': len(invoices_df),
+        'total_purchase_orders': len(po_df),
+        'total_goods_receipts': len(gr_df),
+        'total_events': len(events_df),
+        'date_range_start': invoice_start_date.strftime('%Y-%m-%d'),
+        'date_range_end': datetime.now().strftime('%Y-%m-%d'),
+        'agents_covered': 'VendorIntake,RiskGuard,ContractCraft,InvoiceIQ,PayFlow,Supplier360',
+        'personas_supported': 'Ananya(Procurement),Rohan(Finance),Neha(Manager)',
+        'file_formats': 'CSV,PDF,XLSX,DOCX,JPG,PNG,JSON,HTML'
     }
 
-    description = descriptions.get(event_type, f"{agent} processed {event_type} for {vendor_id}")
-
-    event = {
-        'event_id': f"EVT-{i:05d}",
-        'timestamp': event_time.strftime('%Y-%m-%d %H:%M:%S'),
-        'vendor_id': vendor_id,
-        'invoice_id': random.choice(invoices_df['invoice_id'].tolist()) if 'INVOICE' in event_type else "",
-        'agent_name': agent,
-        'event_type': event_type,
-        'description': description,
-        'status': random.choices(['SUCCESS', 'WARNING', 'ERROR'], weights=[85, 10, 5])[0],
-        'confidence_score': round(random.uniform(0.75, 0.99), 4),
-        'processing_time_ms': random.randint(100, 5000)
+    write_record(manifest, DATA_DIR, "manifest_summary.csv")
+    print(f"   ✓ Generated manifest summary")
+
+    print("\n" + "="*80)
+    print("CSV DATA GENERATION COMPLETE!")
+    print("="*80)
+    print("\nSummary:")
+    print(f"  • Vendors: {len(vendors_df)}")
+    print(f"  • Purchase Orders: {len(po_df)}")
+    print(f"  • Goods Receipts: {len(gr_df)}")
+    print(f"  • Invoices: {len(invoices_df)}")
+    print(f"  • Supplier Records: {len(supplier_df)}")
+    print(f"  • Events: {len(events_df)}")
+    print("\nNext: Run document generation scripts for PDFs, Excel, Word, etc.")
+    print("="*80)
+
+    return {
+        'vendors': vendors_df,
+        'invoices': invoices_df,
+        'po_gr': po_df,
+        'goods_receipts': gr_df,
+        'supplier_history': supplier_df,
+        'events': events_df,
+        'manifest': manifest,
     }
-    events_data.append(event)
-
-# Sort by timestamp
-events_df = pd.DataFrame(events_data)
-events_df = events_df.sort_values('timestamp')
-events_df.to_csv(DATA_DIR / "events_sample.csv", index=False)
-print(f"   ✓ Generated {len(events_df)} event records")
-print(f"     - {len(events_df[events_df['status']=='SUCCESS'])} successful")
-print(f"     - {len(events_df[events_df['status']=='WARNING'])} warnings")
-print(f"     - {len(events_df[events_df['status']=='ERROR'])} errors")
-
-# ============================================================================
-# PHASE 6: GENERATE MANIFEST & SUMMARY
-# ============================================================================
-
-print("\n[6/13] Generating manifest summary...")
-
-manifest = {
-    'dataset_name': 'Source-to-Settle AI Demo Dataset',
-    'version': '1.0.0',
-    'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-    'total_vendors': len(vendors_df),
-    'total_invoices': len(invoices_df),
-    'total_purchase_orders': len(po_df),
-    'total_goods_receipts': len(gr_df),
-    'total_events': len(events_df),
-    'date_range_start': invoice_start_date.strftime('%Y-%m-%d'),
-    'date_range_end': datetime.now().strftime('%Y-%m-%d'),
-    'agents_covered': 'VendorIntake,RiskGuard,ContractCraft,InvoiceIQ,PayFlow,Supplier360',
-    'personas_supported': 'Ananya(Procurement),Rohan(Finance),Neha(Manager)',
-    'file_formats': 'CSV,PDF,XLSX,DOCX,JPG,PNG,JSON,HTML'
-}
-
-manifest_df = pd.DataFrame([manifest])
-manifest_df.to_csv(DATA_DIR / "manifest_summary.csv", index=False)
-print(f"   ✓ Generated manifest summary")
-
-print("\n" + "="*80)
-print("CSV DATA GENERATION COMPLETE!")
-print("="*80)
-print("\nSummary:")
-print(f"  • Vendors: {len(vendors_df)}")
-print(f"  • Purchase Orders: {len(po_df)}")
-print(f"  • Goods Receipts: {len(gr_df)}")
-print(f"  • Invoices: {len(invoices_df)}")
-print(f"  • Supplier Records: {len(supplier_df)}")
-print(f"  • Events: {len(events_df)}")
-print("\nNext: Run document generation scripts for PDFs, Excel, Word, etc.")
-print("="*80)
+
+if __name__ == "__main__":
+    generate_all()
@@ -3,304 +3,233 @@
 Excel and Word Document Generator - Creates realistic business documents
 """
 
-import random
+import functools
+import io
+import zipfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from xml.sax.saxutils import escape as xml_escape
 import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.chart import BarChart, PieChart, Reference
+import xlsxwriter
+import docx
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-
-random.seed(42)
+from dataset import make_output_dirs, read_table
+from parallel import map_records, record_rng
 
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 
-print("="*80)
-print("EXCEL & WORD DOCUMENT GENERATOR")
-print("="*80)
-
-# Load CSV data
-print("\nLoading CSV data...")
-vendors_df = pd.read_csv(DATA_DIR / "vendors.csv")
-invoices_df = pd.read_csv(DATA_DIR / "invoices.csv")
-po_df = pd.read_csv(DATA_DIR / "po_gr.csv")
-supplier_df = pd.read_csv(DATA_DIR / "supplier_history.csv")
+# Scorecard cell formats; XlsxWriter formats belong to one workbook, so each scorecard adds these once
+SCORECARD_FORMATS = {
+    'title': {'font_size': 16, 'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#2E75B6', 'align': 'center', 'valign': 'vcenter'},
+    'label': {'bold': True},
+    'kpi_section': {'font_size': 14, 'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#70AD47', 'align': 'center'},
+    'kpi_header': {'bold': True, 'bg_color': '#A9D08E', 'align': 'center'},
+    'financial_section': {'font_size': 14, 'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#FFC000', 'align': 'center'},
+    'recommendation_section': {'font_size': 14, 'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#C00000', 'align': 'center'},
+    'recommendation': {'font_size': 16, 'bold': True},
+}
 
 # ============================================================================
 # EXCEL DOCUMENTS
 # ============================================================================
 
-print("\n[10/13] Generating Excel documents...")
+def write_data_sheet(wb, name, headers, frame, header_format, max_width=None):
+    """Write a header row plus the frame's rows into a new sheet, in row order for constant_memory workbooks"""
+    ws = wb.add_worksheet(name)
+    # Blank out missing values only in the columns that have any, instead of copying the whole frame
+    na_columns = frame.columns[frame.isna().any()]
+    if len(na_columns):
+        frame = frame.astype({column: object for column in na_columns})
+        frame[na_columns] = frame[na_columns].where(frame[na_columns].notna(), '')
+    if max_width:
+        # Size each column to its longest value (header included), capped at max_width; one column's strings at a time
+        lengths = (frame[column].astype(str).str.len().max() for column in frame.columns)
+        for col_num, (header, length) in enumerate(zip(headers, lengths)):
+            ws.set_column(col_num, col_num, min(max(len(header), length) + 2, max_width))
+    ws.write_row(0, 0, headers, header_format)
+    # Stream plain tuples straight into the sheet; nothing row-sized is kept around
+    for row_num, row in enumerate(frame.itertuples(index=False, name=None), start=1):
+        ws.write_row(row_num, 0, row)
+    return ws
 
 # 1. Vendor Database Excel
-def generate_vendor_database_excel():
+def generate_vendor_database_excel(vendors_df):
     """Generate comprehensive vendor database workbook"""
-    wb = Workbook()
+    wb = xlsxwriter.Workbook(DATA_DIR / "vendors_master_database.xlsx", {'constant_memory': True})
+    header_format = wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092'})
+    centered_header_format = wb.add_format({
+        'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092', 'align': 'center', 'valign': 'vcenter'
+    })
 
     # Sheet 1: Vendor Master
-    ws1 = wb.active
-    ws1.title = "Vendor Master"
-
-    # Headers
-    headers = ['Vendor ID', 'Vendor Name', 'Country', 'Industry', 'Status', 'Risk Band', 'Email', 'Phone']
-    ws1.append(headers)
-
-    # Style headers
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-
-    for col_num, header in enumerate(headers, 1):
-        cell = ws1.cell(row=1, column=col_num)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-
-    # Add data
-    for idx, row in vendors_df.iterrows():
-        ws1.append([
-            row['vendor_id'],
-            row['vendor_name'],
-            row['country'],
-            row['industry'],
-            row['status'],
-            row['risk_band'],
-            row['contact_email'],
-            row['phone']
-        ])
-
-    # Auto-adjust column widths
-    for column in ws1.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws1.column_dimensions[column_letter].width = min(max_length + 2, 50)
+    write_data_sheet(
+        wb, "Vendor Master",
+        ['Vendor ID', 'Vendor Name', 'Country', 'Industry', 'Status', 'Risk Band', 'Email', 'Phone'],
+        vendors_df[['vendor_id', 'vendor_name', 'country', 'industry', 'status', 'risk_band', 'contact_email', 'phone']],
+        centered_header_format,
+        max_width=50
+    )
 
     # Sheet 2: Risk Summary
-    ws2 = wb.create_sheet("Risk Summary")
-    ws2.append(['Risk Band', 'Count', 'Percentage'])
-    ws2.append([''] * 3)
-
-    risk_summary = vendors_df['risk_band'].value_counts()
-    for risk_band, count in risk_summary.items():
-        percentage = (count / len(vendors_df)) * 100
-        ws2.append([risk_band, count, f"{percentage:.1f}%"])
-
-    # Apply styling
-    for col in ws2['A1:C1']:
-        for cell in col:
-            cell.fill = header_fill
-            cell.font = header_font
+    risk_counts = vendors_df['risk_band'].value_counts()
+    risk_percentages = (risk_counts / len(vendors_df) * 100).map('{:.1f}%'.format)
+    ws2 = wb.add_worksheet("Risk Summary")
+    ws2.write_row(0, 0, ['Risk Band', 'Count', 'Percentage'], header_format)
+    rows = zip(risk_counts.index, risk_counts.tolist(), risk_percentages.tolist())
+    for row_num, row in enumerate(rows, start=2):
+        ws2.write_row(row_num, 0, row)
 
     # Sheet 3: Contact List
-    ws3 = wb.create_sheet("Contact List")
-    ws3.append(['Vendor Name', 'Primary Contact', 'Title', 'Email', 'Phone'])
-
-    for idx, row in vendors_df.iterrows():
-        ws3.append([
-            row['vendor_name'],
-            row['primary_contact_name'],
-            row['primary_contact_title'],
-            row['contact_email'],
-            row['phone']
-        ])
-
-    # Style headers
-    for col in ws3['A1:E1']:
-        for cell in col:
-            cell.fill = header_fill
-            cell.font = header_font
-
-    wb.save(DATA_DIR / "vendors_master_database.xlsx")
-    print("   ✓ Generated vendor master database Excel")
+    write_data_sheet(
+        wb, "Contact List",
+        ['Vendor Name', 'Primary Contact', 'Title', 'Email', 'Phone'],
+        vendors_df[['vendor_name', 'primary_contact_name', 'primary_contact_title', 'contact_email', 'phone']],
+        header_format
+    )
 
-generate_vendor_database_excel()
+    wb.close()
+    print("   ✓ Generated vendor master database Excel")
 
 # 2. Supplier Scorecard Excel
-def generate_supplier_scorecard(vendor_id):
-    """Generate detailed supplier scorecard"""
-    vendor_info = vendors_df[vendors_df['vendor_id'] == vendor_id].iloc[0]
-    supplier_info = supplier_df[supplier_df['vendor_id'] == vendor_id]
+def add_kpi_flags(supplier_df):
+    """Add each scorecard KPI's pass/fail flag as a column, computed for every supplier at once"""
+    return supplier_df.assign(
+        on_time_ok=supplier_df['on_time_payment_rate'] >= 95,
+        dispute_ok=supplier_df['dispute_rate'] < 3,
+        cycle_time_ok=supplier_df['average_cycle_time_days'] <= 30,
+        quality_ok=supplier_df['quality_score'] >= 85,
+        delivery_ok=supplier_df['delivery_score'] >= 90,
+        compliance_ok=supplier_df['compliance_score'] >= 95,
+    )
 
-    if len(supplier_info) == 0:
-        return
+def generate_supplier_scorecard(supplier_info):
+    """Generate detailed supplier scorecard from a supplier history record (plus the vendor's industry and KPI flags)"""
+    vendor_id = supplier_info['vendor_id']
 
-    supplier_info = supplier_info.iloc[0]
+    # Scorecards are small: build the whole file in memory and write it out in one go
+    output_path = DATA_DIR / "supplier_performance" / f"{vendor_id}_scorecard.xlsx"
+    buffer = io.BytesIO()
+    wb = xlsxwriter.Workbook(buffer, {'in_memory': True})
+    formats = {name: wb.add_format(properties) for name, properties in SCORECARD_FORMATS.items()}
+    ws = wb.add_worksheet("Scorecard")
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Scorecard"
+    # Adjust column widths
+    ws.set_column(0, 0, 25)
+    ws.set_column(1, 1, 20)
+    ws.set_column(2, 2, 15)
+    ws.set_column(3, 3, 10)
 
     # Title
-    ws.merge_cells('A1:F1')
-    ws['A1'] = f"SUPPLIER PERFORMANCE SCORECARD - {vendor_info['vendor_name']}"
-    ws['A1'].font = Font(size=16, bold=True, color="FFFFFF")
-    ws['A1'].fill = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
-    ws['A1'].alignment = Alignment(horizontal="center", vertical="center")
-    ws.row_dimensions[1].height = 30
-
-    # Basic info
-    ws['A3'] = "Vendor ID:"
-    ws['B3'] = vendor_id
-    ws['A4'] = "Industry:"
-    ws['B4'] = vendor_info['industry']
-    ws['A5'] = "Risk Band:"
-    ws['B5'] = vendor_info['risk_band']
-
-    # Make labels bold
-    for row in [3, 4, 5]:
-        ws[f'A{row}'].font = Font(bold=True)
+    ws.set_row(0, 30)
+    ws.merge_range(0, 0, 0, 5, f"SUPPLIER PERFORMANCE SCORECARD - {supplier_info['vendor_name']}", formats['title'])
+
+    # Basic info, with bold labels
+    basic_info = [
+        ("Vendor ID:", vendor_id),
+        ("Industry:", supplier_info['industry']),
+        ("Risk Band:", supplier_info['risk_band']),
+    ]
+    for row_num, (label, value) in enumerate(basic_info, start=2):
+        ws.write(row_num, 0, label, formats['label'])
+        ws.write(row_num, 1, value)
 
     # KPIs section
-    ws['A7'] = "KEY PERFORMANCE INDICATORS"
-    ws.merge_cells('A7:F7')
-    ws['A7'].font = Font(size=14, bold=True, color="FFFFFF")
-    ws['A7'].fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-    ws['A7'].alignment = Alignment(horizontal="center")
+    ws.merge_range(6, 0, 6, 5, "KEY PERFORMANCE INDICATORS", formats['kpi_section'])
 
     # KPI Table
-    kpi_headers = ['Metric', 'Value', 'Target', 'Status']
-    ws.append([''] * 6)
-    ws.append(kpi_headers + ['', ''])
-
-    header_fill = PatternFill(start_color="A9D08E", end_color="A9D08E", fill_type="solid")
-    for col in ws['A9:D9']:
-        for cell in col:
-            cell.fill = header_fill
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
+    ws.write_row(8, 0, ['Metric', 'Value', 'Target', 'Status'], formats['kpi_header'])
 
     # KPI data
     kpis = [
         ('On-Time Payment Rate', f"{supplier_info['on_time_payment_rate']:.1f}%", "95%",
-         "✓" if supplier_info['on_time_payment_rate'] >= 95 else "⚠"),
+         "✓" if supplier_info['on_time_ok'] else "⚠"),
         ('Dispute Rate', f"{supplier_info['dispute_rate']:.1f}%", "<3%",
-         "✓" if supplier_info['dispute_rate'] < 3 else "⚠"),
+         "✓" if supplier_info['dispute_ok'] else "⚠"),
         ('Avg Cycle Time', f"{supplier_info['average_cycle_time_days']} days", "30 days",
-         "✓" if supplier_info['average_cycle_time_days'] <= 30 else "⚠"),
+         "✓" if supplier_info['cycle_time_ok'] else "⚠"),
         ('Quality Score', f"{supplier_info['quality_score']:.1f}", "85",
-         "✓" if supplier_info['quality_score'] >= 85 else "⚠"),
+         "✓" if supplier_info['quality_ok'] else "⚠"),
         ('Delivery Score', f"{supplier_info['delivery_score']:.1f}", "90",
-         "✓" if supplier_info['delivery_score'] >= 90 else "⚠"),
+         "✓" if supplier_info['delivery_ok'] else "⚠"),
         ('Compliance Score', f"{supplier_info['compliance_score']:.1f}", "95",
-         "✓" if supplier_info['compliance_score'] >= 95 else "⚠"),
+         "✓" if supplier_info['compliance_ok'] else "⚠"),
     ]
 
-    for kpi in kpis:
-        ws.append(list(kpi) + ['', ''])
+    for row_num, kpi in enumerate(kpis, start=9):
+        ws.write_row(row_num, 0, kpi)
 
     # Financial Summary
-    ws.append([''] * 6)
-    ws.append(['FINANCIAL SUMMARY'] + [''] * 5)
-    ws.merge_cells(f'A{ws.max_row}:F{ws.max_row}')
-    ws[f'A{ws.max_row}'].font = Font(size=14, bold=True, color="FFFFFF")
-    ws[f'A{ws.max_row}'].fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
-    ws[f'A{ws.max_row}'].alignment = Alignment(horizontal="center")
-
-    ws.append(['Total Invoices:', supplier_info['total_invoices_processed'], '', '', '', ''])
-    ws.append(['Total Amount Paid:', f"₹{supplier_info['total_amount_paid']:,.2f}", '', '', '', ''])
-    ws.append(['Last Invoice Date:', supplier_info['last_invoice_date'], '', '', '', ''])
+    ws.merge_range(16, 0, 16, 5, "FINANCIAL SUMMARY", formats['financial_section'])
+    ws.write_row(17, 0, ['Total Invoices:', supplier_info['total_invoices_processed']])
+    ws.write_row(18, 0, ['Total Amount Paid:', f"₹{supplier_info['total_amount_paid']:,.2f}"])
+    ws.write_row(19, 0, ['Last Invoice Date:', supplier_info['last_invoice_date']])
 
     # Recommendation
-    ws.append([''] * 6)
-    ws.append(['RECOMMENDATION'] + [''] * 5)
-    ws.merge_cells(f'A{ws.max_row}:F{ws.max_row}')
-    ws[f'A{ws.max_row}'].font = Font(size=14, bold=True, color="FFFFFF")
-    ws[f'A{ws.max_row}'].fill = PatternFill(start_color="C00000", end_color="C00000", fill_type="solid")
-    ws[f'A{ws.max_row}'].alignment = Alignment(horizontal="center")
-
-    ws.append([supplier_info['recommendation'], '', '', '', '', ''])
-    ws[f'A{ws.max_row}'].font = Font(size=16, bold=True)
-
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 20
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 10
-
-    output_path = DATA_DIR / "supplier_performance" / f"{vendor_id}_scorecard.xlsx"
-    wb.save(output_path)
-
-# Generate scorecards for all vendors with history
-for vendor_id in supplier_df['vendor_id'].tolist():
-    generate_supplier_scorecard(vendor_id)
+    ws.merge_range(21, 0, 21, 5, "RECOMMENDATION", formats['recommendation_section'])
+    ws.write(22, 0, supplier_info['recommendation'], formats['recommendation'])
 
-print(f"   ✓ Generated {len(supplier_df)} supplier scorecards")
+    wb.close()
+    output_path.write_bytes(buffer.getvalue())
 
 # 3. Invoice Register Excel
-def generate_invoice_register():
+def generate_invoice_register(invoices_df):
     """Generate invoice tracking register"""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Invoice Register"
-
-    # Headers
-    headers = ['Invoice ID', 'Vendor ID', 'Invoice Number', 'Date', 'Amount', 'Status', 'PO Ref', 'Payment Date']
-    ws.append(headers)
-
-    # Style headers
-    header_fill = PatternFill(start_color="44546A", end_color="44546A", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal="center")
-
-    # Add invoice data
-    for idx, row in invoices_df.iterrows():
-        ws.append([
-            row['invoice_id'],
-            row['vendor_id'],
-            row['invoice_number'],
-            row['invoice_date'],
-            row['total_amount'],
-            row['status'],
-            row['po_reference'] or 'N/A',
-            row['payment_date'] if row['payment_date'] else 'Pending'
-        ])
-
-        # Color code by status
-        current_row = ws.max_row
-        status_cell = ws.cell(row=current_row, column=6)
-
-        if row['status'] == 'MATCHED':
-            status_cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        elif row['status'] == 'EXCEPTION':
-            status_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        elif row['status'] == 'DUPLICATE':
-            status_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-
-    # Auto-adjust columns
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 40)
-
-    wb.save(DATA_DIR / "invoices_register.xlsx")
-    print("   ✓ Generated invoice register Excel")
+    wb = xlsxwriter.Workbook(DATA_DIR / "invoices_register.xlsx", {'constant_memory': True})
+    header_format = wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#44546A', 'align': 'center'})
+
+    register = pd.DataFrame({
+        'invoice_id': invoices_df['invoice_id'],
+        'vendor_id': invoices_df['vendor_id'],
+        'invoice_number': invoices_df['invoice_number'],
+        'invoice_date': invoices_df['invoice_date'],
+        'total_amount': invoices_df['total_amount'],
+        'status': invoices_df['status'],
+        'po_reference': invoices_df['po_reference'].fillna('').replace('', 'N/A'),
+        'payment_date': invoices_df['payment_date'].fillna('').replace('', 'Pending'),
+    })
+    ws = write_data_sheet(
+        wb, "Invoice Register",
+        ['Invoice ID', 'Vendor ID', 'Invoice Number', 'Date', 'Amount', 'Status', 'PO Ref', 'Payment Date'],
+        register,
+        header_format,
+        max_width=40
+    )
+
+    # Color code by status with one conditional rule per status over the whole column, not a fill per cell
+    status_colors = {'MATCHED': '#C6EFCE', 'EXCEPTION': '#FFC7CE', 'DUPLICATE': '#FFEB9C'}
+    if len(register):
+        for status, color in status_colors.items():
+            ws.conditional_format(1, 5, len(register), 5, {
+                'type': 'cell', 'criteria': '==', 'value': f'"{status}"',
+                'format': wb.add_format({'bg_color': color}),
+            })
 
-generate_invoice_register()
+    wb.close()
+    print("   ✓ Generated invoice register Excel")
 
 # ============================================================================
 # WORD DOCUMENTS
 # ============================================================================
 
-print("\n[11/13] Generating Word documents...")
+# python-docx's blank template, read once so each document is parsed from memory instead of disk
+DOCX_TEMPLATE = (Path(docx.__file__).parent / "templates" / "default.docx").read_bytes()
+
+# Review-note colors, shared by every run that uses them
+REVIEW_RED = RGBColor(255, 0, 0)
+REVIEW_BLUE = RGBColor(0, 112, 192)
+
+def new_document():
+    """Start a blank Word document from the cached template bytes"""
+    return Document(io.BytesIO(DOCX_TEMPLATE))
 
 # 1. Contract Draft with Track Changes
-def generate_contract_draft_docx(vendor_row):
-    """Generate contract draft in Word format"""
-    doc = Document()
+@functools.lru_cache(maxsize=None)
+def contract_template(high_risk):
+    """Build the contract draft once per liability variant, with {{placeholders}} for the vendor fields"""
+    doc = new_document()
 
     # Title
     title = doc.add_heading('MASTER SERVICE AGREEMENT', 0)
@@ -310,13 +239,13 @@ def generate_contract_draft_docx(vendor_row):
     subtitle = doc.add_paragraph()
     subtitle.add_run(f"DRAFT - FOR REVIEW").bold = True
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    subtitle.runs[0].font.color.rgb = RGBColor(255, 0, 0)
+    subtitle.runs[0].font.color.rgb = REVIEW_RED
 
     doc.add_paragraph()
 
     # Contract metadata
-    doc.add_paragraph(f"Contract Number: MSA-{vendor_row['vendor_id'].split('-')[1]}-{random.randint(1000,9999)}")
-    doc.add_paragraph(f"Date: {vendor_row['onboarding_date']}")
+    doc.add_paragraph("Contract Number: {{contract_number}}")
+    doc.add_paragraph("Date: {{date}}")
     doc.add_paragraph(f"Version: 1.0 DRAFT")
 
     doc.add_paragraph()
@@ -330,28 +259,27 @@ def generate_contract_draft_docx(vendor_row):
 
     doc.add_heading('AND:', level=2)
     p2 = doc.add_paragraph()
-    p2.add_run(vendor_row['vendor_name']).bold = True
+    p2.add_run('{{vendor_name}}').bold = True
     p2.add_run(' ("Vendor")')
-    doc.add_paragraph(f"{vendor_row['city']}, {vendor_row['state'] or vendor_row['country']}")
+    doc.add_paragraph("{{location}}")
 
     doc.add_page_break()
 
     # Terms
     doc.add_heading('1. SCOPE OF SERVICES', level=1)
     doc.add_paragraph(
-        f"The Vendor agrees to provide {vendor_row['industry']} services to the Company "
-        f"as detailed in the Statement of Work (SOW) attached hereto."
+        "The Vendor agrees to provide {{industry}} services to the Company "
+        "as detailed in the Statement of Work (SOW) attached hereto."
     )
 
     # Add comment simulation
     p = doc.add_paragraph()
     p.add_run('[LEGAL REVIEW: Please specify service deliverables more clearly]')
-    p.runs[0].font.color.rgb = RGBColor(255, 0, 0)
+    p.runs[0].font.color.rgb = REVIEW_RED
     p.runs[0].italic = True
 
     doc.add_heading('2. PAYMENT TERMS', level=1)
-    payment_terms = random.choice(['Net 30', 'Net 45', 'Net 60'])
-    doc.add_paragraph(f"Payment terms: {payment_terms} days from invoice date.")
+    doc.add_paragraph("Payment terms: {{payment_terms}} days from invoice date.")
     doc.add_paragraph("Late payment will attract interest at 18% per annum.")
 
     doc.add_heading('3. TERM AND TERMINATION', level=1)
@@ -361,19 +289,19 @@ def generate_contract_draft_docx(vendor_row):
     # Add revision note
     p = doc.add_paragraph()
     p.add_run('[PROCUREMENT: Consider reducing notice period to 60 days]')
-    p.runs[0].font.color.rgb = RGBColor(0, 112, 192)
+    p.runs[0].font.color.rgb = REVIEW_BLUE
     p.runs[0].italic = True
 
     doc.add_heading('4. LIABILITY AND INDEMNIFICATION', level=1)
-    if vendor_row['risk_band'] == 'HIGH':
+    if high_risk:
         p = doc.add_paragraph("The Vendor's liability shall be unlimited for all claims arising from this Agreement.")
         # Highlight risky clause
-        p.runs[0].font.color.rgb = RGBColor(255, 0, 0)
+        p.runs[0].font.color.rgb = REVIEW_RED
         p.runs[0].bold = True
 
         p = doc.add_paragraph()
         p.add_run('[LEGAL: HIGH RISK - Unlimited liability clause needs revision]')
-        p.runs[0].font.color.rgb = RGBColor(255, 0, 0)
+        p.runs[0].font.color.rgb = REVIEW_RED
         p.runs[0].italic = True
         p.runs[0].bold = True
     else:
@@ -402,31 +330,58 @@ def generate_contract_draft_docx(vendor_row):
     table.cell(2, 0).text = '________________________'
     table.cell(2, 1).text = '________________________'
     table.cell(3, 0).text = 'Authorized Signatory'
-    table.cell(3, 1).text = vendor_row['primary_contact_name']
+    table.cell(3, 1).text = '{{contact_name}}'
     table.cell(4, 0).text = 'Date: ______________'
-    table.cell(4, 1).text = f"Title: {vendor_row['primary_contact_title']}"
+    table.cell(4, 1).text = "Title: {{contact_title}}"
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def render_docx_template(template, values, output_path):
+    """Write a template .docx with its {{placeholders}} replaced by plain string substitution in document.xml
+
+    The archive is assembled in memory and written with a single write, so no partial file is ever on disk.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(template)) as source, \
+            zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == 'word/document.xml':
+                xml = data.decode('utf-8')
+                for name, value in values.items():
+                    xml = xml.replace(f"{{{{{name}}}}}", xml_escape(str(value)))
+                data = xml.encode('utf-8')
+            target.writestr(item, data)
+    Path(output_path).write_bytes(buffer.getvalue())
 
-    # Save
+def generate_contract_draft_docx(vendor_row):
+    """Generate contract draft in Word format"""
+    # Same key as the signed contract PDF, so the draft and the final carry the same number and terms
+    vendor_rng = record_rng(vendor_row['vendor_id'], 'contract')
+    values = {
+        'contract_number': f"MSA-{vendor_row['vendor_id'].split('-')[1]}-{vendor_rng.randint(1000,9999)}",
+        'date': vendor_row['onboarding_date'],
+        'vendor_name': vendor_row['vendor_name'],
+        'location': f"{vendor_row['city']}, {vendor_row['state'] or vendor_row['country']}",
+        'industry': vendor_row['industry'],
+        'payment_terms': vendor_rng.choice(['Net 30', 'Net 45', 'Net 60']),
+        'contact_name': vendor_row['primary_contact_name'],
+        'contact_title': vendor_row['primary_contact_title'],
+    }
     output_path = DATA_DIR / "contracts" / f"{vendor_row['vendor_id']}_contract_draft_v1.docx"
-    doc.save(output_path)
+    render_docx_template(contract_template(vendor_row['risk_band'] == 'HIGH'), values, output_path)
 
-# Generate contract drafts for approved vendors
-approved_vendors = vendors_df[vendors_df['status'] == 'APPROVED']
-for idx, vendor_row in approved_vendors.iterrows():
-    generate_contract_draft_docx(vendor_row)
-
-    if (idx + 1) % 5 == 0:
-        print(f"   Generated {idx + 1}/{len(approved_vendors)} contract drafts...")
-
-print(f"   ✓ Generated {len(approved_vendors)} contract draft Word documents")
 
 # 2. Company Profile Document
-def generate_company_profile(vendor_row):
-    """Generate company profile document"""
-    doc = Document()
+@functools.lru_cache(maxsize=None)
+def company_profile_template(low_risk):
+    """Build the company profile once per certification variant, with {{placeholders}} for the vendor fields"""
+    doc = new_document()
 
     # Header
-    header = doc.add_heading(vendor_row['vendor_name'], 0)
+    header = doc.add_heading('{{vendor_name}}', 0)
     header.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     subtitle = doc.add_paragraph('Company Profile')
@@ -438,9 +393,9 @@ def generate_company_profile(vendor_row):
     # Overview
     doc.add_heading('COMPANY OVERVIEW', level=1)
     doc.add_paragraph(
-        f"{vendor_row['vendor_name']} is a leading {vendor_row['industry']} company "
-        f"based in {vendor_row['city']}, {vendor_row['country']}. With a commitment to excellence "
-        f"and innovation, we have been serving clients globally with best-in-class solutions."
+        "{{vendor_name}} is a leading {{industry}} company "
+        "based in {{city}}, {{country}}. With a commitment to excellence "
+        "and innovation, we have been serving clients globally with best-in-class solutions."
     )
 
     # Key Information
@@ -450,19 +405,19 @@ def generate_company_profile(vendor_row):
     table.style = 'Light Grid Accent 1'
 
     info = [
-        ('Registration Number', vendor_row['registration_number']),
-        ('Industry', vendor_row['industry']),
-        ('Country', vendor_row['country']),
-        ('Website', vendor_row['website']),
-        ('Email', vendor_row['contact_email']),
-        ('Phone', vendor_row['phone']),
-        ('PAN', vendor_row['pan'] or 'N/A'),
-        ('GST', vendor_row['gst'] or 'N/A'),
+        ('Registration Number', 'registration_number'),
+        ('Industry', 'industry'),
+        ('Country', 'country'),
+        ('Website', 'website'),
+        ('Email', 'contact_email'),
+        ('Phone', 'phone'),
+        ('PAN', 'pan'),
+        ('GST', 'gst'),
     ]
 
-    for idx, (label, value) in enumerate(info):
+    for idx, (label, field) in enumerate(info):
         table.cell(idx, 0).text = label
-        table.cell(idx, 1).text = str(value)
+        table.cell(idx, 1).text = f"{{{{{field}}}}}"
         table.cell(idx, 0).paragraphs[0].runs[0].bold = True
 
     # Services
@@ -480,7 +435,7 @@ def generate_company_profile(vendor_row):
     # Certifications
     doc.add_heading('CERTIFICATIONS & COMPLIANCE', level=1)
     certs = ['ISO 9001:2015', 'ISO 27001:2013', 'CMMI Level 5']
-    if vendor_row['risk_band'] == 'LOW':
+    if low_risk:
         certs.extend(['SOC 2 Type II', 'GDPR Compliant'])
 
     for cert in certs:
@@ -488,19 +443,75 @@ def generate_company_profile(vendor_row):
 
     # Contact
     doc.add_heading('PRIMARY CONTACT', level=1)
-    doc.add_paragraph(f"Name: {vendor_row['primary_contact_name']}")
-    doc.add_paragraph(f"Title: {vendor_row['primary_contact_title']}")
-    doc.add_paragraph(f"Email: {vendor_row['contact_email']}")
+    doc.add_paragraph("Name: {{contact_name}}")
+    doc.add_paragraph("Title: {{contact_title}}")
+    doc.add_paragraph("Email: {{contact_email}}")
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
 
+def generate_company_profile(vendor_row):
+    """Generate company profile document"""
+    values = {
+        'vendor_name': vendor_row['vendor_name'],
+        'industry': vendor_row['industry'],
+        'city': vendor_row['city'],
+        'country': vendor_row['country'],
+        'registration_number': vendor_row['registration_number'],
+        'website': vendor_row['website'],
+        'contact_email': vendor_row['contact_email'],
+        'phone': vendor_row['phone'],
+        'pan': vendor_row['pan'] or 'N/A',
+        'gst': vendor_row['gst'] or 'N/A',
+        'contact_name': vendor_row['primary_contact_name'],
+        'contact_title': vendor_row['primary_contact_title'],
+    }
     output_path = DATA_DIR / "kyc_samples" / f"{vendor_row['vendor_id']}_company_profile.docx"
-    doc.save(output_path)
+    render_docx_template(company_profile_template(vendor_row['risk_band'] == 'LOW'), values, output_path)
+
+def main():
+    print("="*80)
+    print("EXCEL & WORD DOCUMENT GENERATOR")
+    print("="*80)
+
+    # Load CSV data
+    print("\nLoading CSV data...")
+    vendors_df = read_table(DATA_DIR, "vendors.csv")
+    invoices_df = read_table(DATA_DIR, "invoices.csv")
+    po_df = read_table(DATA_DIR, "po_gr.csv")
+    supplier_df = read_table(DATA_DIR, "supplier_history.csv")
+
+    make_output_dirs(DATA_DIR)
+
+    print("\n[10/13] Generating Excel documents...")
+
+    generate_vendor_database_excel(vendors_df)
+
+    # Generate scorecards for all vendors with history, one worker job per vendor
+    scorecards = add_kpi_flags(supplier_df.merge(vendors_df[['vendor_id', 'industry']], on='vendor_id', how='inner'))
+    map_records(generate_supplier_scorecard, scorecards.to_dict('records'))
+    print(f"   ✓ Generated {len(scorecards)} supplier scorecards")
+
+    generate_invoice_register(invoices_df)
+
+    print("\n[11/13] Generating Word documents...")
+
+    # Vendor rows are converted to records once and shared by both Word passes
+    vendor_records = vendors_df.to_dict('records')
+
+    # Generate contract drafts for approved vendors
+    approved_vendors = [vendor for vendor in vendor_records if vendor['status'] == 'APPROVED']
+    map_records(generate_contract_draft_docx, approved_vendors)
+    print(f"   ✓ Generated {len(approved_vendors)} contract draft Word documents")
 
-# Generate company profiles
-for idx, vendor_row in vendors_df.iterrows():
-    generate_company_profile(vendor_row)
+    # Generate company profiles
+    map_records(generate_company_profile, vendor_records)
+    print(f"   ✓ Generated {len(vendors_df)} company profile Word documents")
 
-print(f"   ✓ Generated {len(vendors_df)} company profile Word documents")
+    print("\n" + "="*80)
+    print("EXCEL & WORD GENERATION COMPLETE!")
+    print("="*80)
 
-print("\n" + "="*80)
-print("EXCEL & WORD GENERATION COMPLETE!")
-print("="*80)
+if __name__ == "__main__":
+    main()
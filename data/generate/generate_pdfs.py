@@ -3,11 +3,21 @@
 PDF Document Generator - Creates realistic invoice PDFs, KYC documents, contracts
 """
 
+import copy
+import functools
+import hashlib
+import inspect
+import json
 import os
 import random
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 import pandas as pd
+from reportlab import rl_config
+# Skip reportlab's per-attribute shape validation unless debugging the layouts; set before the rest of reportlab loads
+if not os.getenv('DEBUG_PDF'):
+    rl_config.shapeChecking = 0
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
 from reportlab.lib import colors
@@ -15,37 +25,122 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
 from reportlab.pdfgen import canvas
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
+try:
+    # Private to reportlab and only used for the advisory note in main(); if the name goes away, treat it as not found
+    from reportlab.lib.rl_accel import _c_funcs as RL_ACCEL_FUNCS
+except ImportError:
+    RL_ACCEL_FUNCS = {}
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import io
 import qrcode
 import barcode
 from barcode.writer import ImageWriter
+from dataset import make_output_dirs, read_table
+from parallel import map_records, record_rng
 
 random.seed(42)
+rng = np.random.default_rng(42)
 
 BASE_DIR = Path(__file__).parent.parent  # Go up to data/ directory
 DATA_DIR = BASE_DIR  # data/ is the data directory
 
-print("="*80)
-print("PDF DOCUMENT GENERATOR")
-print("="*80)
-
-# Load CSV data
-print("\nLoading CSV data...")
-vendors_df = pd.read_csv(DATA_DIR / "vendors.csv")
-invoices_df = pd.read_csv(DATA_DIR / "invoices.csv")
-po_df = pd.read_csv(DATA_DIR / "po_gr.csv")
-
-print(f"Loaded {len(vendors_df)} vendors, {len(invoices_df)} invoices, {len(po_df)} POs")
+# Progress lines from the worker pool only when asked for (VERBOSE=1); the phase summaries always print
+VERBOSE = bool(os.getenv('VERBOSE'))
+
+# Per-folder records of the inputs each PDF was last rendered from, kept next to the scripts rather than in the
+# published output folders; delete the folder to force a full rebuild
+PDF_HASHES_DIR = Path(__file__).parent / '.pdf_hashes'
+
+# Salt for those records: a digest of this file and of record_rng (which draws the contract numbers), so any change
+# to the layout, style or seeding code re-renders every PDF
+PDF_LAYOUT_SALT = hashlib.blake2b(
+    Path(__file__).read_bytes() + inspect.getsource(record_rng).encode('utf-8'), digest_size=8
+).hexdigest()
+
+def record_hash(record):
+    """Stable digest of a render task's inputs and the layout code that renders them"""
+    payload = json.dumps([PDF_LAYOUT_SALT, record], default=str, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def map_changed(func, tasks, output_dir, output_name, label=None):
+    """map_records over only the tasks whose PDF is missing or whose inputs changed since the last run
+
+    Returns how many tasks were skipped. The hash manifest is read and written here in the parent, never by workers.
+    """
+    PDF_HASHES_DIR.mkdir(exist_ok=True)
+    manifest_path = PDF_HASHES_DIR / f"{output_dir.name}.json"
+    previous = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    hashes = {output_name(task): record_hash(task) for task in tasks}
+    stale = [
+        task for task in tasks
+        if previous.get(output_name(task)) != hashes[output_name(task)] or not (output_dir / output_name(task)).exists()
+    ]
+    map_records(func, stale, label=label)
+    manifest_path.write_text(json.dumps({**previous, **hashes}, indent=1, sort_keys=True))
+    return len(tasks) - len(stale)
+
+def build_pdf(story, output_path=None):
+    """Lay out a story on A4 in memory, then write it to output_path in one go (or return the bytes if no path is given)"""
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, pagesize=A4).build(story)
+    if output_path is None:
+        return buffer.getvalue()
+    Path(output_path).write_bytes(buffer.getvalue())
+
+def fresh(flowables):
+    """Shallow copies of shared flowables for one document
+
+    Parsing stays shared, but layout state such as reportlab's page-break postponement mark stays per document.
+    """
+    return [copy.copy(flowable) for flowable in flowables]
+
+@functools.lru_cache(maxsize=None)
+def _parse_paragraph(text, style):
+    return Paragraph(text, style)
+
+def fixed_paragraph(text, style):
+    """A Paragraph for fixed text whose markup is parsed once per process rather than per document"""
+    return copy.copy(_parse_paragraph(text, style))
+
+def warm_reportlab():
+    """Build a throwaway page in the parent so font metrics and paragraph machinery are loaded once
+
+    Worker processes are forked from the parent, so they inherit the warm caches instead of each paying the cold start.
+    """
+    table = Table([['Warm', 'Up']])
+    table.setStyle(KYC_TABLE_STYLE)
+    build_pdf([Paragraph("<b>Warm</b> <i>up</i>", TITLE_STYLE), Paragraph("Warm up", STYLES['Normal']), table])
 
 # ============================================================================
 # INVOICE PDF GENERATION
 # ============================================================================
 
-print("\n[7/13] Generating invoice PDFs...")
-
+LINE_ITEM_DESCRIPTIONS = [
+    "Professional Services",
+    "Software License",
+    "Hardware Equipment",
+    "Consulting Services",
+    "Maintenance Support",
+    "Training Services",
+    "IT Infrastructure",
+    "Cloud Services"
+]
+DESCRIPTIONS = np.array(LINE_ITEM_DESCRIPTIONS)
+
+def draw_line_items(line_item_counts):
+    """Draw the random parts of every invoice's line items in one go, one (factor, qty, description) list per invoice"""
+    counts = np.asarray(line_item_counts, dtype=np.int64)
+    total_items = int(counts.sum())
+    factors = rng.uniform(0.5, 1.5, size=total_items).tolist()
+    qtys = rng.integers(1, 51, size=total_items).tolist()
+    descriptions = DESCRIPTIONS[rng.integers(0, len(DESCRIPTIONS), size=total_items)].tolist()
+    items = list(zip(factors, qtys, descriptions))
+    offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+    return [items[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+@functools.lru_cache(maxsize=None)
 def create_vendor_logo(vendor_name, size=(150, 60)):
-    """Create simple text-based logo"""
+    """Create simple text-based logo, cached per vendor (callers must not mutate the returned image)"""
     img = Image.new('RGB', size, color='white')
     draw = ImageDraw.Draw(img)
 
@@ -57,47 +152,87 @@ def create_vendor_logo(vendor_name, size=(150, 60)):
         (52, 152, 219), (46, 204, 113), (155, 89, 182),
         (52, 73, 94), (230, 126, 34), (231, 76, 60)
     ]
-    color = random.choice(colors_list)
+    color = record_rng(vendor_name, 'logo').choice(colors_list)
 
     draw.rectangle([0, 0, size[0], size[1]], fill=color)
     draw.text((size[0]//2, size[1]//2), initials, fill='white', anchor='mm')
 
     return img
 
+@functools.lru_cache(maxsize=None)
 def create_qr_code(data):
-    """Generate QR code"""
+    """Generate QR code, cached per payload"""
     qr = qrcode.QRCode(version=1, box_size=3, border=1)
     qr.add_data(data)
     qr.make(fit=True)
     return qr.make_image(fill_color="black", back_color="white")
 
-def generate_digital_invoice_pdf(invoice_row, vendor_row, output_path):
-    """Generate clean digital invoice PDF"""
-    doc = SimpleDocTemplate(str(output_path), pagesize=A4)
+# Invoice styles are built once and shared by every invoice
+INVOICE_TEXT_COLOR = colors.HexColor('#2C3E50')
+INVOICE_HEADER_COLOR = colors.HexColor('#34495E')
+INVOICE_TOTAL_COLOR = colors.HexColor('#E74C3C')
+
+STYLES = getSampleStyleSheet()
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=STYLES['Heading1'],
+    fontSize=24,
+    textColor=INVOICE_TEXT_COLOR,
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+INVOICE_TITLE_STYLE = ParagraphStyle('InvoiceTitle', parent=STYLES['Heading2'], alignment=TA_CENTER, fontSize=16)
+SIGNATURE_STYLE = ParagraphStyle('Signature', parent=STYLES['Normal'], alignment=TA_RIGHT)
+
+INVOICE_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TEXTCOLOR', (0, 0), (-1, -1), INVOICE_TEXT_COLOR),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+ITEMS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), INVOICE_HEADER_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
+])
+TOTALS_TABLE_STYLE = TableStyle([
+    ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (2, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (2, -1), (-1, -1), 12),
+    ('LINEABOVE', (2, -1), (-1, -1), 2, colors.black),
+    ('TEXTCOLOR', (2, -1), (-1, -1), INVOICE_TOTAL_COLOR),
+])
+BANK_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+def generate_digital_invoice_pdf(invoice_row, vendor_row, output_path, line_items):
+    """Generate clean digital invoice PDF from pre-drawn (factor, qty, description) line items"""
     story = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
 
     # Company header
-    story.append(Paragraph(f"<b>{vendor_row['vendor_name']}</b>", title_style))
-    story.append(Paragraph(f"{vendor_row['city']}, {vendor_row['state'] or vendor_row['country']}", styles['Normal']))
-    story.append(Paragraph(f"Email: {vendor_row['contact_email']} | Phone: {vendor_row['phone']}", styles['Normal']))
+    story.append(Paragraph(f"<b>{vendor_row['vendor_name']}</b>", TITLE_STYLE))
+    story.append(Paragraph(vendor_row['party_location'], STYLES['Normal']))
+    story.append(Paragraph(f"Email: {vendor_row['contact_email']} | Phone: {vendor_row['phone']}", STYLES['Normal']))
 
     if vendor_row['gst']:
-        story.append(Paragraph(f"<b>GSTIN:</b> {vendor_row['gst']}", styles['Normal']))
+        story.append(Paragraph(f"<b>GSTIN:</b> {vendor_row['gst']}", STYLES['Normal']))
     story.append(Spacer(1, 0.3*inch))
 
     # Invoice title
-    invoice_title = Paragraph(f"<b>TAX INVOICE</b>", ParagraphStyle('InvoiceTitle', parent=styles['Heading2'], alignment=TA_CENTER, fontSize=16))
+    invoice_title = fixed_paragraph("<b>TAX INVOICE</b>", INVOICE_TITLE_STYLE)
     story.append(invoice_title)
     story.append(Spacer(1, 0.2*inch))
 
@@ -109,196 +244,185 @@ def generate_digital_invoice_pdf(invoice_row, vendor_row, output_path):
     ]
 
     invoice_table = Table(invoice_data, colWidths=[2*inch, 2*inch, 2*inch, 2*inch])
-    invoice_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2C3E50')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    invoice_table.setStyle(INVOICE_TABLE_STYLE)
     story.append(invoice_table)
     story.append(Spacer(1, 0.3*inch))
 
     # Bill To section
-    story.append(Paragraph("<b>Bill To:</b>", styles['Heading3']))
-    story.append(Paragraph("Acme Corporation Pvt Ltd", styles['Normal']))
-    story.append(Paragraph("123 Business Park, Mumbai - 400001", styles['Normal']))
-    story.append(Paragraph("GSTIN: 27AABCU9603R1ZM", styles['Normal']))
+    story.append(fixed_paragraph("<b>Bill To:</b>", STYLES['Heading3']))
+    story.append(fixed_paragraph("Acme Corporation Pvt Ltd", STYLES['Normal']))
+    story.append(fixed_paragraph("123 Business Park, Mumbai - 400001", STYLES['Normal']))
+    story.append(fixed_paragraph("GSTIN: 27AABCU9603R1ZM", STYLES['Normal']))
     story.append(Spacer(1, 0.3*inch))
 
     # Line items
-    story.append(Paragraph("<b>Items:</b>", styles['Heading3']))
+    story.append(fixed_paragraph("<b>Items:</b>", STYLES['Heading3']))
 
     line_items_data = [
         ['#', 'Description', 'Qty', 'Rate', 'Amount']
     ]
 
-    # Generate random line items
-    num_items = invoice_row['line_items']
+    # Split the base amount over the pre-drawn line items
+    fmt = "₹{:,.2f}".format
+    num_items = len(line_items)
     remaining_amount = invoice_row['base_amount']
 
-    for i in range(num_items):
+    for i, (factor, qty, description) in enumerate(line_items):
         if i == num_items - 1:
             item_amount = remaining_amount
         else:
-            item_amount = round(remaining_amount / (num_items - i) * random.uniform(0.5, 1.5), 2)
+            item_amount = round(remaining_amount / (num_items - i) * factor, 2)
             remaining_amount -= item_amount
 
-        qty = random.randint(1, 50)
         rate = round(item_amount / qty, 2)
 
-        descriptions = [
-            "Professional Services",
-            "Software License",
-            "Hardware Equipment",
-            "Consulting Services",
-            "Maintenance Support",
-            "Training Services",
-            "IT Infrastructure",
-            "Cloud Services"
-        ]
-
         line_items_data.append([
             str(i+1),
-            random.choice(descriptions),
+            description,
             str(qty),
-            f"₹{rate:,.2f}",
-            f"₹{item_amount:,.2f}"
+            fmt(rate),
+            fmt(item_amount)
         ])
 
     items_table = Table(line_items_data, colWidths=[0.5*inch, 3.5*inch, 1*inch, 1.5*inch, 1.5*inch])
-    items_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
-    ]))
+    items_table.setStyle(ITEMS_TABLE_STYLE)
     story.append(items_table)
     story.append(Spacer(1, 0.2*inch))
 
     # Totals section
+    money = {key: fmt(invoice_row[key]) for key in ('base_amount', 'cgst', 'sgst', 'total_amount')}
     totals_data = [
-        ['', '', 'Subtotal:', f"₹{invoice_row['base_amount']:,.2f}"],
-        ['', '', 'CGST (9%):', f"₹{invoice_row['cgst']:,.2f}"],
-        ['', '', 'SGST (9%):', f"₹{invoice_row['sgst']:,.2f}"],
-        ['', '', '<b>Total Amount:</b>', f"<b>₹{invoice_row['total_amount']:,.2f}</b>"],
+        ['', '', 'Subtotal:', money['base_amount']],
+        ['', '', 'CGST (9%):', money['cgst']],
+        ['', '', 'SGST (9%):', money['sgst']],
+        ['', '', '<b>Total Amount:</b>', f"<b>{money['total_amount']}</b>"],
     ]
 
     totals_table = Table(totals_data, colWidths=[2*inch, 2*inch, 2*inch, 2*inch])
-    totals_table.setStyle(TableStyle([
-        ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (2, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (2, -1), (-1, -1), 12),
-        ('LINEABOVE', (2, -1), (-1, -1), 2, colors.black),
-        ('TEXTCOLOR', (2, -1), (-1, -1), colors.HexColor('#E74C3C')),
-    ]))
+    totals_table.setStyle(TOTALS_TABLE_STYLE)
     story.append(totals_table)
     story.append(Spacer(1, 0.3*inch))
 
     # Bank details
-    story.append(Paragraph("<b>Bank Details:</b>", styles['Heading3']))
+    story.append(fixed_paragraph("<b>Bank Details:</b>", STYLES['Heading3']))
     bank_data = [
         ['Bank Name:', 'HDFC Bank'],
         ['Account Number:', vendor_row['bank_account']],
         ['IFSC Code:', vendor_row['ifsc_code'] or 'HDFC0001234'],
-        ['Branch:', f"{vendor_row['city']} Branch"]
+        ['Branch:', vendor_row['bank_branch']]
     ]
 
     bank_table = Table(bank_data, colWidths=[2*inch, 4*inch])
-    bank_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
+    bank_table.setStyle(BANK_TABLE_STYLE)
     story.append(bank_table)
     story.append(Spacer(1, 0.3*inch))
 
     # Terms and signature
-    story.append(Paragraph("<b>Terms & Conditions:</b>", styles['Heading3']))
-    story.append(Paragraph("1. Payment due within terms specified above", styles['Normal']))
-    story.append(Paragraph("2. Interest @18% p.a. will be charged on delayed payments", styles['Normal']))
-    story.append(Paragraph("3. All disputes subject to Mumbai jurisdiction", styles['Normal']))
+    story.append(fixed_paragraph("<b>Terms & Conditions:</b>", STYLES['Heading3']))
+    story.append(fixed_paragraph("1. Payment due within terms specified above", STYLES['Normal']))
+    story.append(fixed_paragraph("2. Interest @18% p.a. will be charged on delayed payments", STYLES['Normal']))
+    story.append(fixed_paragraph("3. All disputes subject to Mumbai jurisdiction", STYLES['Normal']))
     story.append(Spacer(1, 0.4*inch))
 
-    story.append(Paragraph("<b>For " + vendor_row['vendor_name'] + "</b>", ParagraphStyle('Signature', parent=styles['Normal'], alignment=TA_RIGHT)))
+    story.append(Paragraph("<b>For " + vendor_row['vendor_name'] + "</b>", SIGNATURE_STYLE))
     story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("<b>Authorized Signatory</b>", ParagraphStyle('Signature', parent=styles['Normal'], alignment=TA_RIGHT)))
+    story.append(fixed_paragraph("<b>Authorized Signatory</b>", SIGNATURE_STYLE))
 
     # Build PDF
-    doc.build(story)
+    return build_pdf(story, output_path)
 
-def generate_scanned_invoice_pdf(invoice_row, vendor_row, output_path):
+def generate_scanned_invoice_pdf(invoice_row, vendor_row, output_path, line_items):
     """Generate scanned-looking invoice PDF with imperfections"""
-    # First create as digital
-    temp_path = output_path.parent / f"temp_{output_path.name}"
-    generate_digital_invoice_pdf(invoice_row, vendor_row, temp_path)
-
-    # For now, just copy as scanned (real scanning simulation would require pdf2image)
+    # For now, render the digital layout straight to the scanned path (real scanning simulation would require pdf2image)
     # In production, you'd convert to image, add noise, rotate, then back to PDF
-    import shutil
-    shutil.copy(temp_path, output_path)
-    temp_path.unlink()
-
-# Generate invoice PDFs
-digital_count = 0
-scanned_count = 0
-image_count = 0
-
-for idx, invoice_row in invoices_df.iterrows():
-    invoice_id = invoice_row['invoice_id']
-    vendor_id = invoice_row['vendor_id']
-    vendor_row = vendors_df[vendors_df['vendor_id'] == vendor_id].iloc[0]
-
-    # Choose format
-    format_choice = random.choices(
-        ['digital', 'scanned', 'image'],
-        weights=[50, 40, 10]
-    )[0]
-
-    if format_choice == 'digital' or idx < 40:
-        output_path = DATA_DIR / "invoices_pdf" / f"{invoice_id}_digital.pdf"
-        generate_digital_invoice_pdf(invoice_row, vendor_row, output_path)
-        digital_count += 1
-    elif format_choice == 'scanned':
-        output_path = DATA_DIR / "invoices_pdf" / f"{invoice_id}_scanned.pdf"
-        generate_scanned_invoice_pdf(invoice_row, vendor_row, output_path)
-        scanned_count += 1
-
-    if (idx + 1) % 20 == 0:
-        print(f"   Generated {idx + 1}/{len(invoices_df)} invoice PDFs...")
-
-print(f"   ✓ Generated {len(invoices_df)} invoice PDFs")
-print(f"     - {digital_count} digital PDFs")
-print(f"     - {scanned_count} scanned-style PDFs")
+    return generate_digital_invoice_pdf(invoice_row, vendor_row, output_path, line_items)
+
+def generate_invoice_pdf(task):
+    """Render one invoice in its chosen format (runs in a worker process)"""
+    invoice_row = task['invoice']
+    output_path = DATA_DIR / "invoices_pdf" / f"{invoice_row['invoice_id']}_{task['format']}.pdf"
+    if task['format'] == 'digital':
+        generate_digital_invoice_pdf(invoice_row, task['vendor'], output_path, task['line_items'])
+    else:
+        generate_scanned_invoice_pdf(invoice_row, task['vendor'], output_path, task['line_items'])
+
 
 # ============================================================================
 # KYC DOCUMENT GENERATION
 # ============================================================================
 
-print("\n[8/13] Generating KYC document PDFs...")
+# KYC and contract styles, shared by every document like the invoice ones above
+KYC_TITLE_STYLE = ParagraphStyle('Title', parent=STYLES['Title'], alignment=TA_CENTER, fontSize=18)
+FOOTER_STYLE = ParagraphStyle('Footer', parent=STYLES['Normal'], fontSize=8, textColor=colors.grey, alignment=TA_CENTER)
+
+# Run-wide invariants of the KYC layout; the footer (its date is per run) and spacer are copied into each document
+KYC_COL_WIDTHS = [2.5*inch, 4*inch]
+CHECKLIST_COL_WIDTHS = [4*inch, 2.5*inch]
+KYC_SECTION_SPACER = Spacer(1, 0.3*inch)
+KYC_FOOTER = Paragraph(f"<i>Document generated on {datetime.now().strftime('%Y-%m-%d')}</i>", FOOTER_STYLE)
+
+# The company, risk and bank tables share one style
+KYC_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+])
+CHECKLIST_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+# Checklist documents whose status is drawn at random
+KYC_DRAWN_CHECKS = [
+    'Registration Certificate',
+    'Bank Statement',
+    'ISO Certification',
+    'Trade License',
+    'Insurance Certificate',
+]
+
+# Submission probability per (risk band, document) in KYC_DRAWN_CHECKS order: row 0 for LOW risk vendors
+# (better compliance), row 1 for the rest
+KYC_CHECK_PROBS = np.array([
+    [0.95, 0.95, 0.6, 0.95, 0.8],
+    [0.7, 0.7, 0.6, 0.7, 0.8],
+])
+
+# Indexed by the boolean draw: False -> missing, True -> submitted
+KYC_CHECK_LABELS = np.array(['✗ Missing', '✓ Submitted'])
+
+def draw_kyc_checks(risk_bands):
+    """Draw every vendor's KYC risk score and checklist statuses in one go, one (score, {document: status}) pair per vendor"""
+    risk_bands = np.asarray(risk_bands)
+    n = len(risk_bands)
+    risk_scores = rng.integers(60, 96, size=n).tolist()
+    probs = KYC_CHECK_PROBS[(risk_bands != 'LOW').astype(int)]
+    # Drawn document-major, so the stream matches one draw per document across all vendors
+    submitted = rng.random((len(KYC_DRAWN_CHECKS), n)).T < probs
+    statuses = KYC_CHECK_LABELS[submitted.astype(int)].tolist()
+    return [
+        (score, dict(zip(KYC_DRAWN_CHECKS, row)))
+        for score, row in zip(risk_scores, statuses)
+    ]
 
-def generate_kyc_pdf(vendor_row, output_path):
-    """Generate comprehensive KYC document"""
-    doc = SimpleDocTemplate(str(output_path), pagesize=A4)
+def generate_kyc_pdf(vendor_row, output_path, risk_score, checks):
+    """Generate comprehensive KYC document from a pre-drawn risk score and checklist statuses"""
     story = []
-    styles = getSampleStyleSheet()
 
     # Title
-    title = Paragraph("<b>KNOW YOUR CUSTOMER (KYC) DOCUMENT</b>",
-                     ParagraphStyle('Title', parent=styles['Title'], alignment=TA_CENTER, fontSize=18))
+    title = fixed_paragraph("<b>KNOW YOUR CUSTOMER (KYC) DOCUMENT</b>", KYC_TITLE_STYLE)
     story.append(title)
-    story.append(Spacer(1, 0.3*inch))
+    story.append(copy.copy(KYC_SECTION_SPACER))
 
     # Company details
-    story.append(Paragraph("<b>Company Information</b>", styles['Heading2']))
+    story.append(fixed_paragraph("<b>Company Information</b>", STYLES['Heading2']))
     company_data = [
         ['Company Name:', vendor_row['vendor_name']],
         ['Registration Number:', vendor_row['registration_number']],
@@ -311,20 +435,13 @@ def generate_kyc_pdf(vendor_row, output_path):
         ['Website:', vendor_row['website']],
     ]
 
-    company_table = Table(company_data, colWidths=[2.5*inch, 4*inch])
-    company_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-    ]))
+    company_table = Table(company_data, colWidths=KYC_COL_WIDTHS)
+    company_table.setStyle(KYC_TABLE_STYLE)
     story.append(company_table)
-    story.append(Spacer(1, 0.3*inch))
+    story.append(copy.copy(KYC_SECTION_SPACER))
 
     # Risk Assessment
-    story.append(Paragraph("<b>Risk Assessment</b>", styles['Heading2']))
-    risk_score = random.randint(60, 95)
+    story.append(fixed_paragraph("<b>Risk Assessment</b>", STYLES['Heading2']))
     risk_data = [
         ['Risk Band:', vendor_row['risk_band']],
         ['Risk Score:', f"{risk_score}/100"],
@@ -332,161 +449,151 @@ def generate_kyc_pdf(vendor_row, output_path):
         ['Last Reviewed:', vendor_row['last_updated']],
     ]
 
-    risk_table = Table(risk_data, colWidths=[2.5*inch, 4*inch])
-    risk_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-    ]))
+    risk_table = Table(risk_data, colWidths=KYC_COL_WIDTHS)
+    risk_table.setStyle(KYC_TABLE_STYLE)
     story.append(risk_table)
-    story.append(Spacer(1, 0.3*inch))
+    story.append(copy.copy(KYC_SECTION_SPACER))
 
     # Banking Details
-    story.append(Paragraph("<b>Banking Details</b>", styles['Heading2']))
+    story.append(fixed_paragraph("<b>Banking Details</b>", STYLES['Heading2']))
     bank_data = [
         ['Account Number:', vendor_row['bank_account']],
         ['IFSC Code:', vendor_row['ifsc_code'] or 'N/A'],
         ['SWIFT Code:', vendor_row['swift_code'] or 'N/A'],
-        ['Bank Branch:', f"{vendor_row['city']} Branch"],
+        ['Bank Branch:', vendor_row['bank_branch']],
     ]
 
-    bank_table = Table(bank_data, colWidths=[2.5*inch, 4*inch])
-    bank_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-    ]))
+    bank_table = Table(bank_data, colWidths=KYC_COL_WIDTHS)
+    bank_table.setStyle(KYC_TABLE_STYLE)
     story.append(bank_table)
-    story.append(Spacer(1, 0.3*inch))
+    story.append(copy.copy(KYC_SECTION_SPACER))
 
     # Compliance Checklist
-    story.append(Paragraph("<b>Compliance Checklist</b>", styles['Heading2']))
-
-    # Better compliance for LOW risk vendors
-    is_low_risk = vendor_row['risk_band'] == 'LOW'
-    compliance_prob = 0.95 if is_low_risk else 0.7
+    story.append(fixed_paragraph("<b>Compliance Checklist</b>", STYLES['Heading2']))
 
     checklist_data = [
         ['Document', 'Status'],
-        ['Registration Certificate', random.choices(['✓ Submitted', '✗ Missing'], weights=[compliance_prob, 1-compliance_prob])[0]],
+        ['Registration Certificate', checks['Registration Certificate']],
         ['PAN Card', '✓ Verified' if vendor_row['pan'] else '✗ Not Applicable'],
         ['GST Certificate', '✓ Verified' if vendor_row['gst'] else '✗ Not Applicable'],
-        ['Bank Statement', random.choices(['✓ Submitted', '✗ Missing'], weights=[compliance_prob, 1-compliance_prob])[0]],
-        ['ISO Certification', random.choices(['✓ Submitted', '✗ Missing'], weights=[0.6, 0.4])[0]],
-        ['Trade License', random.choices(['✓ Submitted', '✗ Missing'], weights=[compliance_prob, 1-compliance_prob])[0]],
-        ['Insurance Certificate', random.choices(['✓ Submitted', '✗ Missing'], weights=[0.8, 0.2])[0]],
+        ['Bank Statement', checks['Bank Statement']],
+        ['ISO Certification', checks['ISO Certification']],
+        ['Trade License', checks['Trade License']],
+        ['Insurance Certificate', checks['Insurance Certificate']],
     ]
 
-    checklist_table = Table(checklist_data, colWidths=[4*inch, 2.5*inch])
-    checklist_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    checklist_table = Table(checklist_data, colWidths=CHECKLIST_COL_WIDTHS)
+    checklist_table.setStyle(CHECKLIST_TABLE_STYLE)
     story.append(checklist_table)
-    story.append(Spacer(1, 0.3*inch))
+    story.append(copy.copy(KYC_SECTION_SPACER))
 
     # Authorized Signatory
-    story.append(Paragraph("<b>Authorized Representative</b>", styles['Heading2']))
-    story.append(Paragraph(f"Name: {vendor_row['primary_contact_name']}", styles['Normal']))
-    story.append(Paragraph(f"Title: {vendor_row['primary_contact_title']}", styles['Normal']))
-    story.append(Spacer(1, 0.3*inch))
+    story.append(fixed_paragraph("<b>Authorized Representative</b>", STYLES['Heading2']))
+    story.append(Paragraph(f"Name: {vendor_row['primary_contact_name']}", STYLES['Normal']))
+    story.append(Paragraph(f"Title: {vendor_row['primary_contact_title']}", STYLES['Normal']))
+    story.append(copy.copy(KYC_SECTION_SPACER))
 
     # Footer
-    story.append(Paragraph(f"<i>Document generated on {datetime.now().strftime('%Y-%m-%d')}</i>",
-                          ParagraphStyle('Footer', parent=styles['Normal'], fontSize=8, textColor=colors.grey, alignment=TA_CENTER)))
+    story.append(copy.copy(KYC_FOOTER))
 
-    doc.build(story)
+    return build_pdf(story, output_path)
 
-# Generate KYC PDFs for all vendors
-for idx, vendor_row in vendors_df.iterrows():
-    vendor_id = vendor_row['vendor_id']
-    output_path = DATA_DIR / "kyc_samples" / f"{vendor_id}_KYC.pdf"
-    generate_kyc_pdf(vendor_row, output_path)
+def kyc_pdf_name(task):
+    return f"{task['vendor']['vendor_id']}_KYC.pdf"
 
-    if (idx + 1) % 5 == 0:
-        print(f"   Generated {idx + 1}/{len(vendors_df)} KYC documents...")
+def render_kyc_pdf(task):
+    """Render one vendor's KYC document (runs in a worker process)"""
+    output_path = DATA_DIR / "kyc_samples" / kyc_pdf_name(task)
+    generate_kyc_pdf(task['vendor'], output_path, task['risk_score'], task['checks'])
 
-print(f"   ✓ Generated {len(vendors_df)} KYC document PDFs")
 
 # ============================================================================
 # CONTRACT DOCUMENT GENERATION
 # ============================================================================
 
-print("\n[9/13] Generating contract PDFs...")
+CONTRACT_TITLE_STYLE = ParagraphStyle('Title', parent=STYLES['Title'], alignment=TA_CENTER, fontSize=20)
+SIGNATURE_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+])
+
+# Fixed contract text, parsed into flowables once; each contract gets fresh() copies of them
+CONTRACT_COMPANY_PARTY = [
+    Paragraph("<b>BETWEEN:</b>", STYLES['Heading2']),
+    Paragraph("<b>Acme Corporation Pvt Ltd</b> (\"Company\")", STYLES['Normal']),
+    Paragraph("123 Business Park, Mumbai - 400001", STYLES['Normal']),
+    Spacer(1, 0.2*inch),
+    Paragraph("<b>AND:</b>", STYLES['Heading2']),
+]
+CONTRACT_TERMINATION_CLAUSE = [
+    Paragraph("<b>3. TERM AND TERMINATION</b>", STYLES['Heading2']),
+    Paragraph("Initial term: 2 years from effective date, renewable annually.", STYLES['Normal']),
+    Paragraph("Either party may terminate with 90 days written notice.", STYLES['Normal']),
+    Spacer(1, 0.2*inch),
+]
+# Keyed by whether the vendor is HIGH risk, which gets the "risky" clause
+CONTRACT_LIABILITY_CLAUSE = {
+    high_risk: [
+        Paragraph("<b>4. LIABILITY</b>", STYLES['Heading2']),
+        Paragraph(clause, STYLES['Normal']),
+        Spacer(1, 0.2*inch),
+    ]
+    for high_risk, clause in [
+        (True, "<font color='red'>Vendor's liability shall be unlimited for all claims.</font>"),
+        (False, "Vendor's liability limited to 12 months of fees paid."),
+    ]
+}
+CONTRACT_CLOSING_CLAUSES = [
+    Paragraph("<b>5. CONFIDENTIALITY</b>", STYLES['Heading2']),
+    Paragraph("Both parties agree to maintain confidentiality of proprietary information.", STYLES['Normal']),
+    Paragraph("Confidentiality obligations survive termination for 5 years.", STYLES['Normal']),
+    Spacer(1, 0.2*inch),
+    Paragraph("<b>6. COMPLIANCE</b>", STYLES['Heading2']),
+    Paragraph("Vendor shall comply with all applicable laws and regulations.", STYLES['Normal']),
+    Paragraph("Vendor warrants it has all necessary licenses and permits.", STYLES['Normal']),
+    Spacer(1, 0.3*inch),
+]
 
 def generate_contract_pdf(vendor_row, output_path):
     """Generate service contract PDF"""
-    doc = SimpleDocTemplate(str(output_path), pagesize=A4)
+    vendor_rng = record_rng(vendor_row['vendor_id'], 'contract')
     story = []
-    styles = getSampleStyleSheet()
 
     # Title
-    title = Paragraph("<b>MASTER SERVICE AGREEMENT</b>",
-                     ParagraphStyle('Title', parent=styles['Title'], alignment=TA_CENTER, fontSize=20))
+    title = fixed_paragraph("<b>MASTER SERVICE AGREEMENT</b>", CONTRACT_TITLE_STYLE)
     story.append(title)
     story.append(Spacer(1, 0.2*inch))
 
     # Contract details
-    contract_number = f"MSA-{vendor_row['vendor_id'].split('-')[1]}-{random.randint(1000,9999)}"
+    contract_number = f"MSA-{vendor_row['vendor_num']}-{vendor_rng.randint(1000,9999)}"
     contract_date = vendor_row['onboarding_date']
 
-    story.append(Paragraph(f"<b>Contract Number:</b> {contract_number}", styles['Normal']))
-    story.append(Paragraph(f"<b>Effective Date:</b> {contract_date}", styles['Normal']))
+    story.append(Paragraph(f"<b>Contract Number:</b> {contract_number}", STYLES['Normal']))
+    story.append(Paragraph(f"<b>Effective Date:</b> {contract_date}", STYLES['Normal']))
     story.append(Spacer(1, 0.3*inch))
 
     # Parties
-    story.append(Paragraph("<b>BETWEEN:</b>", styles['Heading2']))
-    story.append(Paragraph("<b>Acme Corporation Pvt Ltd</b> (\"Company\")", styles['Normal']))
-    story.append(Paragraph("123 Business Park, Mumbai - 400001", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-
-    story.append(Paragraph("<b>AND:</b>", styles['Heading2']))
-    story.append(Paragraph(f"<b>{vendor_row['vendor_name']}</b> (\"Vendor\")", styles['Normal']))
-    story.append(Paragraph(f"{vendor_row['city']}, {vendor_row['state'] or vendor_row['country']}", styles['Normal']))
+    story.extend(fresh(CONTRACT_COMPANY_PARTY))
+    story.append(Paragraph(f"<b>{vendor_row['vendor_name']}</b> (\"Vendor\")", STYLES['Normal']))
+    story.append(Paragraph(vendor_row['party_location'], STYLES['Normal']))
     story.append(Spacer(1, 0.3*inch))
 
     # Terms
-    story.append(Paragraph("<b>1. SCOPE OF SERVICES</b>", styles['Heading2']))
-    story.append(Paragraph(f"Vendor agrees to provide {vendor_row['industry']} services as detailed in attached Statements of Work (SOW).", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-
-    story.append(Paragraph("<b>2. PAYMENT TERMS</b>", styles['Heading2']))
-    payment_terms = random.choice(['Net 30', 'Net 45', 'Net 60'])
-    story.append(Paragraph(f"Payment terms: {payment_terms} days from invoice date.", styles['Normal']))
-    story.append(Paragraph("Late payment interest: 18% per annum.", styles['Normal']))
+    story.append(fixed_paragraph("<b>1. SCOPE OF SERVICES</b>", STYLES['Heading2']))
+    story.append(Paragraph(f"Vendor agrees to provide {vendor_row['industry']} services as detailed in attached Statements of Work (SOW).", STYLES['Normal']))
     story.append(Spacer(1, 0.2*inch))
 
-    story.append(Paragraph("<b>3. TERM AND TERMINATION</b>", styles['Heading2']))
-    story.append(Paragraph("Initial term: 2 years from effective date, renewable annually.", styles['Normal']))
-    story.append(Paragraph("Either party may terminate with 90 days written notice.", styles['Normal']))
+    story.append(fixed_paragraph("<b>2. PAYMENT TERMS</b>", STYLES['Heading2']))
+    payment_terms = vendor_rng.choice(['Net 30', 'Net 45', 'Net 60'])
+    story.append(Paragraph(f"Payment terms: {payment_terms} days from invoice date.", STYLES['Normal']))
+    story.append(fixed_paragraph("Late payment interest: 18% per annum.", STYLES['Normal']))
     story.append(Spacer(1, 0.2*inch))
 
-    story.append(Paragraph("<b>4. LIABILITY</b>", styles['Heading2']))
+    story.extend(fresh(CONTRACT_TERMINATION_CLAUSE))
     # Add some "risky" clauses for certain vendors
-    if vendor_row['risk_band'] == 'HIGH':
-        story.append(Paragraph("<font color='red'>Vendor's liability shall be unlimited for all claims.</font>", styles['Normal']))
-    else:
-        story.append(Paragraph("Vendor's liability limited to 12 months of fees paid.", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-
-    story.append(Paragraph("<b>5. CONFIDENTIALITY</b>", styles['Heading2']))
-    story.append(Paragraph("Both parties agree to maintain confidentiality of proprietary information.", styles['Normal']))
-    story.append(Paragraph("Confidentiality obligations survive termination for 5 years.", styles['Normal']))
-    story.append(Spacer(1, 0.2*inch))
-
-    story.append(Paragraph("<b>6. COMPLIANCE</b>", styles['Heading2']))
-    story.append(Paragraph("Vendor shall comply with all applicable laws and regulations.", styles['Normal']))
-    story.append(Paragraph("Vendor warrants it has all necessary licenses and permits.", styles['Normal']))
-    story.append(Spacer(1, 0.3*inch))
+    story.extend(fresh(CONTRACT_LIABILITY_CLAUSE[vendor_row['risk_band'] == 'HIGH']))
+    story.extend(fresh(CONTRACT_CLOSING_CLAUSES))
 
     # Signatures
     story.append(Spacer(1, 0.5*inch))
@@ -499,27 +606,120 @@ def generate_contract_pdf(vendor_row, output_path):
     ]
 
     sig_table = Table(signature_data, colWidths=[3.5*inch, 3.5*inch])
-    sig_table.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-    ]))
+    sig_table.setStyle(SIGNATURE_TABLE_STYLE)
     story.append(sig_table)
 
-    doc.build(story)
+    return build_pdf(story, output_path)
+
+def contract_pdf_name(vendor_row):
+    return f"{vendor_row['vendor_id']}_contract_final_signed.pdf"
+
+def render_contract_pdf(vendor_row):
+    """Render one approved vendor's signed contract (runs in a worker process)"""
+    generate_contract_pdf(vendor_row, DATA_DIR / "contracts" / contract_pdf_name(vendor_row))
+
+def add_vendor_text_columns(vendors_df):
+    """Add the per-vendor strings the documents print (location line, bank branch, contract number prefix), for every vendor at once"""
+    # state and country are categoricals; compare and combine them as plain strings
+    state = vendors_df['state'].astype(str)
+    return vendors_df.assign(
+        party_location=vendors_df['city'] + ', ' + state.where(state != '', vendors_df['country'].astype(str)),
+        bank_branch=vendors_df['city'] + ' Branch',
+        vendor_num=vendors_df['vendor_id'].str.split('-').str[1],
+    )
+
+def main():
+    print("="*80)
+    print("PDF DOCUMENT GENERATOR")
+    print("="*80)
+
+    # Load CSV data (typed reads; blank cells stay empty strings, so the 'or N/A' fallbacks apply)
+    print("\nLoading CSV data...")
+    vendors_df = add_vendor_text_columns(read_table(DATA_DIR, "vendors.csv"))
+    invoices_df = read_table(DATA_DIR, "invoices.csv")
+    po_df = read_table(DATA_DIR, "po_gr.csv")
+
+    print(f"Loaded {len(vendors_df)} vendors, {len(invoices_df)} invoices, {len(po_df)} POs")
+
+    make_output_dirs(DATA_DIR)
+
+    # reportlab picks up the rl_accel C extension on its own when it is installed
+    if not RL_ACCEL_FUNCS:
+        print("Note: reportlab C accelerator not found (pip install rl_accel for faster PDF rendering)")
+
+    warm_reportlab()
+
+    print("\n[7/13] Generating invoice PDFs...")
+
+    # Pick each invoice's format here, then render them in worker processes
+    tasks = []
+    digital_count = 0
+    scanned_count = 0
+
+    # One hash lookup per invoice instead of a boolean scan over every vendor
+    vendor_lookup = {vendor['vendor_id']: vendor for vendor in vendors_df.to_dict('records')}
+
+    # Line items are drawn up front in the parent, so they don't depend on which worker renders them
+    invoice_line_items = draw_line_items(invoices_df['line_items'])
+
+    for idx, invoice_row in enumerate(invoices_df.to_dict('records')):
+        # Choose format
+        format_choice = random.choices(
+            ['digital', 'scanned', 'image'],
+            weights=[50, 40, 10]
+        )[0]
+
+        if format_choice == 'digital' or idx < 40:
+            format_choice = 'digital'
+            digital_count += 1
+        elif format_choice == 'scanned':
+            scanned_count += 1
+        else:
+            continue
+
+        tasks.append({
+            'invoice': invoice_row,
+            'vendor': vendor_lookup[invoice_row['vendor_id']],
+            'format': format_choice,
+            'line_items': invoice_line_items[idx],
+        })
+
+    map_records(generate_invoice_pdf, tasks, label="invoices" if VERBOSE else None)
+
+    print(f"   ✓ Generated {len(invoices_df)} invoice PDFs")
+    print(f"     - {digital_count} digital PDFs")
+    print(f"     - {scanned_count} scanned-style PDFs")
+
+    print("\n[8/13] Generating KYC document PDFs...")
+
+    # Generate KYC PDFs for all vendors in worker processes; vendor rows go over as plain dicts,
+    # with their risk scores and checklist statuses drawn up front like the invoice line items
+    vendor_records = vendors_df.to_dict('records')
+    kyc_checks = draw_kyc_checks(vendors_df['risk_band'])
+    kyc_tasks = [
+        {'vendor': vendor, 'risk_score': risk_score, 'checks': checks}
+        for vendor, (risk_score, checks) in zip(vendor_records, kyc_checks)
+    ]
+    # Vendors whose KYC inputs are unchanged since the last run keep their existing PDF
+    skipped = map_changed(render_kyc_pdf, kyc_tasks, DATA_DIR / "kyc_samples", kyc_pdf_name, label="KYC documents" if VERBOSE else None)
+
+    print(f"   ✓ Generated {len(kyc_tasks) - skipped} KYC document PDFs")
+    if skipped:
+        print(f"     - {skipped} unchanged since the last run, kept as is")
+
+    print("\n[9/13] Generating contract PDFs...")
 
-# Generate contract PDFs
-for idx, vendor_row in vendors_df.iterrows():
-    if vendor_row['status'] == 'APPROVED':
-        vendor_id = vendor_row['vendor_id']
-        output_path = DATA_DIR / "contracts" / f"{vendor_id}_contract_final_signed.pdf"
-        generate_contract_pdf(vendor_row, output_path)
+    # Generate contract PDFs for the approved vendors, from the same records
+    approved_vendors = [vendor for vendor in vendor_records if vendor['status'] == 'APPROVED']
+    skipped = map_changed(render_contract_pdf, approved_vendors, DATA_DIR / "contracts", contract_pdf_name, label="contracts" if VERBOSE else None)
 
-        if (idx + 1) % 5 == 0:
-            print(f"   Generated {idx + 1}/{len(vendors_df)} contracts...")
+    print(f"   ✓ Generated {len(approved_vendors) - skipped} contract PDFs for approved vendors")
+    if skipped:
+        print(f"     - {skipped} unchanged since the last run, kept as is")
 
-print(f"   ✓ Generated contract PDFs for approved vendors")
+    print("\n" + "="*80)
+    print("PDF GENERATION COMPLETE!")
+    print("="*80)
 
-print("\n" + "="*80)
-print("PDF GENERATION COMPLETE!")
-print("="*80)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Process-pool helper shared by the document generator scripts
+"""
+
+import gc
+import hashlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+def record_rng(*key):
+    """A Random seeded from the record's key, so a document's draws don't depend on which worker renders it or in what order
+
+    Seeds come from md5 rather than hash(), which is salted per process.
+    """
+    digest = hashlib.md5(':'.join(map(str, key)).encode('utf-8')).hexdigest()
+    return random.Random(int(digest[:8], 16))
+
+def _run_batch(func, batch):
+    """Worker side of map_records: run func over one batch of records"""
+    return [func(record) for record in batch]
+
+def map_records(func, records, chunksize=None, label=None):
+    """Run func over plain-dict records in worker processes, returning the results in order
+
+    Records are shipped in batches (by default about four per worker) so small jobs don't pay IPC per record.
+    With a label, a progress line is printed from the parent at roughly every tenth of the records completed.
+    """
+    workers = max(1, (os.cpu_count() or 1) - 1)
+    if workers == 1 or len(records) < 2:
+        return [func(record) for record in records]
+    if chunksize is None:
+        chunksize = max(1, len(records) // (4 * workers))
+    batches = [records[start:start + chunksize] for start in range(0, len(records), chunksize)]
+    results = [None] * len(batches)
+    done = 0
+    reported_tenth = 0
+    # Move everything alive at fork time (loaded tables, records, warm caches) out of the collector's
+    # generations, so forked workers' collections neither rescan it nor dirty its copy-on-write pages
+    gc.freeze()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_batch, func, batch): index for index, batch in enumerate(batches)}
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                done += len(batches[index])
+                if label and done * 10 // len(records) > reported_tenth:
+                    print(f"   {label}: {done}/{len(records)}")
+                    reported_tenth = done * 10 // len(records)
+    finally:
+        gc.unfreeze()
+    return [result for batch in results for result in batch]